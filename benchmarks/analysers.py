@@ -0,0 +1,46 @@
+"""
+compares the analysers on a synthetic novel whose chapter costs are already known
+
+usage: python -m benchmarks.analysers [chapters]
+"""
+import random
+import sys
+import time
+
+from webnovel.analytic import Efficient, ForwardCrawl, HardLine, Optimal
+from webnovel.models import Chapter, Novel, Profile
+
+
+def synthetic(count, seed=0):
+    rng = random.Random(seed)
+    return [Chapter(no=i, id=i, locked=True, cost=rng.choice((5, 7, 9, 11, 13, 15, 20))) for i in range(count)]
+
+
+def main(count=10000):
+    novel = Novel(id=0)
+    profile = Profile(coins=count * 4, fastpass=count // 50)
+
+    analysers = {
+        'Efficient': Efficient(novel, profile, maximum_cost=15),
+        'ForwardCrawl': ForwardCrawl(novel, profile, maximum_cost=15),
+        'HardLine': HardLine(novel, profile, coins_line=11, fastpass_line=13),
+        'Optimal': Optimal(novel, profile, maximum_cost=15),
+        'Optimal(contiguous)': Optimal(novel, profile, maximum_cost=15, contiguous=True),
+    }
+
+    print(f'{count} chapters, {profile.coins} coins, {profile.fastpass} fastpass, maximum cost 15')
+    print()
+    print(f'{"analyser":<20} {"seconds":>8} {"unlocked":>9} {"coins":>8} {"fastpass":>9}')
+    for name, analyser in analysers.items():
+        chapters = synthetic(count)
+
+        start = time.perf_counter()
+        analysis = analyser.analyse(chapters)
+        elapsed = time.perf_counter() - start
+
+        unlocked = len(analysis.via_coins) + len(analysis.via_fastpass)
+        print(f'{name:<20} {elapsed:>8.4f} {unlocked:>9} {analysis.coins_cost:>8} {analysis.fastpass_cost:>9}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
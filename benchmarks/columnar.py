@@ -0,0 +1,45 @@
+"""
+compares a large table of contents as Chapter objects and as ColumnarToc,
+in memory held, and in time to reload from json or from a saved ColumnarToc
+
+usage: python -m benchmarks.columnar [chapters]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from webnovel.api import ParsedApi, BaseApi
+from webnovel.models import ColumnarToc
+from .decode import synthetic
+from .memory import measure
+
+NOVEL_ID = 12345678901234567
+
+
+def main(count=10000):
+    content = synthetic(count, novel_id=NOVEL_ID)
+    response = BaseApi.validate_content(content)
+
+    chapters = [c for v in ParsedApi.parse_toc(NOVEL_ID, response).values() for c in v]
+    toc = ParsedApi.parse_columnar_toc(NOVEL_ID, response)
+    assert [c.id for c in chapters] == list(toc.ids)
+    assert [c.locked for c in chapters] == [bool(locked) for locked in toc.locked]
+
+    path = os.path.join(tempfile.mkdtemp(), 'toc.bin')
+    toc.save(path)
+    assert ColumnarToc.load(path).ids == toc.ids
+
+    print(f'{count} chapters, json {len(content) / 1024:.0f} KiB, saved {os.path.getsize(path) / 1024:.0f} KiB')
+    print()
+    print(f'{"memory Chapter":<24} {measure(lambda: ParsedApi.parse_toc(NOVEL_ID, response)) / 2 ** 20:>8.2f} MB')
+    print(f'{"memory ColumnarToc":<24} {measure(lambda: ParsedApi.parse_columnar_toc(NOVEL_ID, response)) / 2 ** 20:>8.2f} MB')
+
+    for name, func in [('reload from json', lambda: ParsedApi.parse_toc(NOVEL_ID, BaseApi.validate_content(content))),
+                       ('reload from saved', lambda: ColumnarToc.load(path))]:
+        elapsed = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print(f'{name:<24} {elapsed * 1000:>8.2f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+counts the WebDriver commands each scraping method issues, on a real browser
+
+the novel and chapter are loaded before counting, so only the scraping is counted.
+signed in methods are skipped unless cookies of a signed in browser are given
+
+usage: python -m benchmarks.commands novel_url chapter_url [browser]
+"""
+import sys
+
+from webnovel import WebnovelBot, Cookies
+
+
+class Counter:
+    """
+    wraps WebDriver.execute, through which every command is sent
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+
+        driver.execute = self.execute
+
+    def execute(self, *args, **kwargs):
+        self.count += 1
+        return self._execute(*args, **kwargs)
+
+
+def main(novel_url, chapter_url, browser=None):
+    bot = WebnovelBot(timeout=30)
+    counter = Counter(bot.driver)
+
+    if browser is not None:
+        bot.add_cookiejar(Cookies.from_browser(browser))
+
+    cases = [
+        ('novel', novel_url, lambda: bot.novel()),
+        ('chapter', chapter_url, lambda: bot.chapter()),
+    ]
+    if browser is not None:
+        cases += [
+            ('profile', None, lambda: bot.profile()),
+            ('library', 'https://www.webnovel.com/library', lambda: bot.library(redirect=False)),
+        ]
+
+    try:
+        for name, url, method in cases:
+            if url is not None:
+                bot.driver.get(url)
+
+            counter.count = 0
+            method()
+            print(f'{name:<10} {counter.count:>4} commands')
+    finally:
+        bot.close()
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
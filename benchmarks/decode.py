@@ -0,0 +1,70 @@
+"""
+compares decoding a large synthetic GetChapterList response
+against the previous approach of json.loads, and checks both agree
+
+usage: python -m benchmarks.decode [chapters]
+"""
+import json
+import sys
+import timeit
+
+from webnovel.api import ParsedApi, BaseApi
+from webnovel.api.decode import orjson
+from webnovel.models import Chapter
+
+
+def synthetic(count, per_volume=100, novel_id=12345678901234567):
+    volumes = [
+        {
+            'index': v + 1,
+            'name': f'Volume name {v}' if v % 2 else '',
+            'chapterItems': [
+                {'id': novel_id + i, 'index': i, 'name': f'Chapter {i}: a chapter title', 'isAuth': int(i < 50),
+                 'chapterLevel': 0, 'isVip': 1, 'createTime': '2 years ago'}
+                for i in range(v * per_volume, min(count, (v + 1) * per_volume))
+            ]
+        }
+        for v in range((count + per_volume - 1) // per_volume)
+    ]
+
+    return json.dumps({'code': 0, 'msg': 'Success', 'data': {'volumeItems': volumes}}).encode()
+
+
+def previous(novel_id, content):
+    response = json.loads(content)
+    if response['code'] != 0:
+        raise ValueError
+
+    volumes = {}
+    for volume_item in response['data']['volumeItems']:
+        volumes[ParsedApi.parse_volume_name(volume_item)] = [
+            Chapter(
+                no=item['index'],
+                id=item['id'],
+                url=f'https://www.webnovel.com/book/{novel_id}/{item["id"]}',
+                title=item['name'],
+                locked=not int(item['isAuth']),
+            ) for item in volume_item['chapterItems']
+        ]
+
+    return volumes
+
+
+def current(novel_id, content):
+    return ParsedApi.parse_toc(novel_id, BaseApi.validate_content(content))
+
+
+def main(count=10000):
+    content = synthetic(count)
+    novel_id = 1
+
+    assert previous(novel_id, content) == current(novel_id, content)
+
+    print(f'{count} chapters, {len(content) / 1024:.0f} KiB, orjson {"installed" if orjson else "not installed"}')
+    for name, func in [('previous', previous), ('current', current)]:
+        elapsed = min(timeit.repeat(lambda: func(novel_id, content), number=10, repeat=5)) / 10
+        print(f'{name:<10} {elapsed * 1000:>8.2f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
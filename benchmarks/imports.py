@@ -0,0 +1,44 @@
+"""
+measures the time to import webnovel.api and ParsedApi from it in a fresh interpreter,
+and checks it stays under a budget without importing the browser and parsing dependencies
+
+usage: python -m benchmarks.imports [budget ms] [runs]
+"""
+import json
+import subprocess
+import sys
+
+IMPORT = 'from webnovel.api import ParsedApi'
+
+# dependencies an api only user should not pay for at import
+DEFERRED = ['selenium', 'bs4', 'lxml', 'numpy', 'aiohttp', 'browser_cookie3']
+
+SCRIPT = f'''
+import json, sys, time
+start = time.perf_counter()
+{IMPORT}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted({{m.split('.')[0] for m in sys.modules}})}}))
+'''
+
+
+def measure():
+    output = subprocess.run([sys.executable, '-c', SCRIPT], check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+
+def main(budget=250, runs=5):
+    results = [measure() for _ in range(runs)]
+    elapsed = min(result['elapsed'] for result in results) * 1000
+
+    imported = [name for name in DEFERRED if name in results[0]['modules']]
+
+    print(f'{IMPORT}  {elapsed:.1f} ms, budget {budget} ms')
+    print(f'deferred dependencies imported: {", ".join(imported) or "none"}')
+
+    assert not imported, f'{IMPORT!r} imported {", ".join(imported)}'
+    assert elapsed <= budget, f'{IMPORT!r} took {elapsed:.1f} ms, over the budget of {budget} ms'
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
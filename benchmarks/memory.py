@@ -0,0 +1,55 @@
+"""
+compares the memory held by a 10k chapter table of contents, and by chapters with content,
+as Chapter and as CompactChapter
+
+usage: python -m benchmarks.memory [chapters] [paragraphs]
+"""
+import sys
+import tracemalloc
+
+from webnovel.models import Chapter, CompactChapter
+
+NOVEL_ID = 12345678901234567
+
+
+def chapters(count, paragraphs):
+    return [
+        Chapter(
+            no=i,
+            id=NOVEL_ID + i,
+            url=f'https://www.webnovel.com/book/{NOVEL_ID}/{NOVEL_ID + i}',
+            title=f'Chapter {i}: a chapter title',
+            paragraphs=[f'paragraph {p} of chapter {i}, with some text in it.' for p in range(paragraphs)]
+            if paragraphs else None,
+            locked=i > 50,
+            cost=None,
+            type=0,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(build):
+    tracemalloc.start()
+    held = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del held
+    return size
+
+
+def main(count=10000, paragraphs=40):
+    print(f'{count} chapters')
+    print()
+    print(f'{"":<32} {"Chapter":>10} {"Compact":>10}')
+
+    for label, n in [('table of contents', 0), (f'with {paragraphs} paragraphs each', paragraphs)]:
+        plain = measure(lambda: chapters(count, n))
+        compact = measure(lambda: [CompactChapter.from_chapter(c, NOVEL_ID) for c in chapters(count, n)])
+
+        print(f'{label:<32} {plain / 2 ** 20:>8.2f}MB {compact / 2 ** 20:>8.2f}MB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""
+compares page load times of a default chrome driver against one from create_driver,
+for the novel, chapter and library pages
+
+usage: python -m benchmarks.page_loads novel_url chapter_url [repeat]
+"""
+import sys
+import time
+
+from selenium import webdriver
+
+from webnovel.driver import create_driver
+
+LIBRARY_URL = 'https://www.webnovel.com/library'
+
+
+def timed_loads(driver, urls, repeat):
+    timings = {}
+    try:
+        for name, url in urls:
+            elapsed = []
+            for _ in range(repeat):
+                # a blank page in between, so each load starts from nothing
+                driver.get('about:blank')
+
+                start = time.perf_counter()
+                driver.get(url)
+                elapsed.append(time.perf_counter() - start)
+
+            timings[name] = min(elapsed)
+    finally:
+        driver.quit()
+
+    return timings
+
+
+def main(novel_url, chapter_url, repeat=3):
+    urls = [('novel', novel_url), ('chapter', chapter_url), ('library', LIBRARY_URL)]
+
+    default = timed_loads(webdriver.Chrome(), urls, int(repeat))
+    fast = timed_loads(create_driver(), urls, int(repeat))
+
+    print(f'{"":<10} {"default":>10} {"factory":>10}')
+    for name, _ in urls:
+        print(f'{name:<10} {default[name] * 1000:>8.0f}ms {fast[name] * 1000:>8.0f}ms')
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
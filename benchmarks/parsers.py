@@ -0,0 +1,124 @@
+"""
+compares the page parsers on synthetic novel, profile and table of contents pages,
+against the previous approach of a BeautifulSoup of the whole page, and checks all agree
+
+usage: python -m benchmarks.parsers [chapters]
+"""
+import re
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from webnovel.models import Chapter
+from webnovel.parsers import SoupParser, XPathParser
+
+NOVEL_ID = 12345678901234567
+URL = f'https://www.webnovel.com/book/{NOVEL_ID}'
+
+# rest of the page, which none of the parsers need
+FILLER = ''.join(
+    f'<div class="g_row rec-{i}"><a href="/book/{i}" title="Recommended {i}"><img src="/{i}.jpg"/>'
+    f'<h3 class="title">Recommended novel {i}</h3><p class="synopsis">{"words " * 40}</p></a></div>'
+    for i in range(300)
+)
+
+
+def novel_page():
+    return f'''<html><head><title>Novel</title><script>var g_data = {{}};</script></head><body>
+    {FILLER}
+    <div class="g_wrap det-info">
+      <div class="_mn">
+        <h2 class="pt4 pb4 oh mb4">Novel Title <small>TL</small></h2>
+        <p class="ell dib vam"><a class="c_000" href="/category">Fantasy</a><span> 2,345 Chapters</span><span>1.2M Views</span></p>
+        <address class="lh20 mb24 mr24"><p><strong>Author:</strong><span>Someone</span>
+          <strong>Translator:</strong><span>Another</span><strong>Editor:</strong><span>Third</span></p></address>
+        <p class="mb12 h20"><strong>4.5</strong><small>(1,234 reviews)</small></p>
+      </div>
+    </div>
+    <div class="g_txt_over j_synopsis"><p>A synopsis of the novel, in a single paragraph.</p></div>
+    {FILLER}
+    </body></html>'''
+
+
+def profile_page():
+    return f'''<html><body>{FILLER}
+    <div class="fl"><a class="dib mr32" title="Coins">125</a><a class="dib mr32" title="Fast Pass">3</a>
+      <a class="dib mr16" title="Power Stone">1</a><a class="dib mr16" title="Energy Stone">5</a></div>
+    {FILLER}</body></html>'''
+
+
+def toc_page(count):
+    volumes = []
+    for v in range((count + 99) // 100):
+        items = ''.join(
+            f'<li class="g_col_6"><a href="//www.webnovel.com/book/{NOVEL_ID}/{NOVEL_ID + i}" '
+            f'title="Chapter {i}: a chapter title" class="c_000 db pr clearfix pt8 pb8 pr8 pl8">'
+            f'<i class="fl fs16 lh24 c_l _num mr4 tal">{i}</i><strong>Chapter {i}</strong>'
+            + ('<svg class="_icon"><use xlink:href="#i-lock"></use></svg>' if i > 50 else '') +
+            '</a></li>'
+            for i in range(v * 100, min(count, (v + 1) * 100))
+        )
+        volumes.append(f'<div class="volume-item"><h4 class="">\n          Volume {v + 1}:Volume name</h4>'
+                       f'<ol class="content-list">{items}</ol></div>')
+
+    return f'<html><body>{FILLER}<div class="j_catalog_list">{"".join(volumes)}</div>{FILLER}</body></html>'
+
+
+def previous_profile(html):
+    soup = BeautifulSoup(html, 'lxml')
+    group = soup.select("div[class='fl'] > a.dib.mr32, div[class='fl'] > a.dib.mr16")
+
+    return [int(element.text) for element in group[:4]]
+
+
+def previous_toc(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    volumes = {}
+    for volume_element in soup.find_all('div', {'class': 'volume-item'}):
+        chapters = []
+        for chapter in volume_element.find_all('li', {'class': 'g_col_6'}):
+            no_element = chapter.select_one('a > i')
+            chapter = Chapter(
+                title=chapter.select_one('a')['title'],
+                url=f"http:{chapter.find('a')['href'].strip()}",
+                locked=bool(chapter.select('a > svg')),
+                no=int(no_element.text.strip()) if no_element is not None else 0,
+            )
+            chapter.id = chapter.chapter_id_from_url()
+            chapters.append(chapter)
+
+        volumes[re.sub(r'\n +', '', volume_element.find('h4').text).replace(':', ': ')] = chapters
+
+    return volumes
+
+
+def main(count=2000):
+    soup, xpath = SoupParser(), XPathParser()
+    novel, profile, toc = novel_page(), profile_page(), toc_page(count)
+
+    assert soup.novel(novel, URL) == xpath.novel(novel, URL)
+    assert soup.novel(novel, URL).translator == 'Another'
+    assert [getattr(soup.profile(profile), f) for f in ('coins', 'fastpass', 'power_stone', 'energy_stone')] == \
+           [getattr(xpath.profile(profile), f) for f in ('coins', 'fastpass', 'power_stone', 'energy_stone')] == \
+           previous_profile(profile)
+    assert previous_toc(toc) == soup.table_of_contents(toc) == xpath.table_of_contents(toc)
+
+    cases = [
+        # previous novel parsing is only timed to building the soup
+        ('novel', lambda: BeautifulSoup(novel, 'lxml'), lambda p: p.novel(novel, URL)),
+        ('profile', lambda: previous_profile(profile), lambda p: p.profile(profile)),
+        (f'toc {count}', lambda: previous_toc(toc), lambda p: p.table_of_contents(toc)),
+    ]
+
+    print(f'{"":<12} {"previous":>10} {"soup":>10} {"xpath":>10}')
+    for name, previous, func in cases:
+        timings = [
+            min(timeit.repeat(f, number=5, repeat=3)) / 5 * 1000
+            for f in (previous, lambda: func(soup), lambda: func(xpath))
+        ]
+        print(f'{name:<12}' + ''.join(f' {t:>8.2f}ms' for t in timings))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+compares extracting the text of unlocked chapter paragraphs with TextTools
+against the previous approach of a BeautifulSoup per paragraph, and checks both agree
+
+usage: python -m benchmarks.text [chapters] [paragraphs]
+"""
+import random
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from webnovel.tools import TextTools
+
+# shapes of paragraph content seen in chapter responses
+TEMPLATES = [
+    '{words}',
+    '<p>{words}</p>',
+    '<p>{words}</p>\n',
+    '  <p>{words}</p>',
+    '<p>"{words}," she said.</p>',
+    '<p><em>{words}</em> {words}</p>',
+    '<p>{words}<br/>{words}</p>',
+    '<p>{words} &amp; {words} &hellip;&nbsp;&#8220;{words}&#8221;</p>',
+    '<p class="cha-paragraph" data-ejs=\'{{"a": 1}}\'>{words}</p>',
+    '<p>{words} &lt;{words}&gt;</p>',
+    '<p>{words}<!-- pirate -->{words}</p>',
+    '<span style="display:none">{words}</span>{words}',
+    '{words}\r\n{words}',
+    '<p>{words} 3 < 4 > 2</p>',
+    '<p>你好，{words}。</p>',
+]
+
+WORDS = 'the of and to a in he was that it his her with as had for you on at said but not'.split()
+
+
+def paragraph(rng):
+    return rng.choice(TEMPLATES).format(words=' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 30))))
+
+
+def previous(contents):
+    return [BeautifulSoup(para['content'], 'lxml').text for para in contents]
+
+
+def current(contents):
+    return TextTools.paragraphs(contents)
+
+
+def main(chapters=300, paragraphs=80):
+    rng = random.Random(0)
+    contents = [{'content': paragraph(rng)} for _ in range(chapters * paragraphs)]
+
+    assert previous(contents) == current(contents)
+
+    print(f'{chapters} chapters of {paragraphs} paragraphs')
+    for name, func in [('previous', previous), ('current', current)]:
+        elapsed = min(timeit.repeat(lambda: func(contents), number=1, repeat=3))
+        print(f'{name:<10} {elapsed * 1000:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -18,6 +18,12 @@ setup(
     long_description_content_type='text/markdown',
 
     install_requires=requirements,
+    extras_require={
+        # optional accelerators, used when installed
+        'fast': ['orjson', 'numpy'],
+        # encrypted session files
+        'session': ['cryptography'],
+    },
 
     classifiers=[
         'License :: OSI Approved :: MIT License',
@@ -32,5 +38,5 @@ setup(
         'Source code': 'https://github.com/mHaisham/webnovelbot'
     },
     packages=find_packages(),
-    python_requires='>=3.6'
+    python_requires='>=3.7'
 )
@@ -1,5 +1,10 @@
-from .bot import WebnovelBot
-from .cookies import Cookies
-from .exceptions import NotSignedInException
+from .lazy import lazy_attributes
 
 __version__ = '0.3.0'
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    'WebnovelBot': '.bot',
+    'Cookies': '.cookies',
+    'NotSignedInException': '.exceptions',
+    'SessionStore': '.session',
+})
@@ -1,5 +1,12 @@
-from .analysis import Analysis
-from .crawl import ForwardCrawl
-from .efficient import Efficient
-from .hard import HardLine
-from .interface import IAnalyser
+from ..lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    'Analysis': '.analysis',
+    'ForwardCrawl': '.crawl',
+    'Efficient': '.efficient',
+    'HardLine': '.hard',
+    'IAnalyser': '.interface',
+    'Optimal': '.optimal',
+    'Sweep': '.sweep',
+    'Scenario': '.sweep',
+})
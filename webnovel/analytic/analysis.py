@@ -6,17 +6,59 @@ from ..models import Chapter
 
 @dataclass
 class Analysis:
+    """
+    chapters selected for each unlock method
+
+    totals are kept as chapters are added and removed, so reading them is constant time.
+    use the add and remove methods rather than changing [via_coins] and [via_fastpass] directly,
+    otherwise the totals will go stale
+    """
     via_coins: List[Chapter]
     via_fastpass: List[Chapter]
 
+    def __post_init__(self):
+        self._coins_cost = sum([c.cost for c in self.via_coins])
+
     @staticmethod
     def empty():
         return Analysis(via_coins=[], via_fastpass=[])
 
+    def add_coins(self, chapter: Chapter):
+        self.via_coins.append(chapter)
+        self._coins_cost += chapter.cost
+
+    def remove_coins(self, chapter: Chapter):
+        """
+        :raises ValueError: if chapter is not selected for coins
+        """
+        self.via_coins.remove(chapter)
+        self._coins_cost -= chapter.cost
+
+    def add_fastpass(self, chapter: Chapter):
+        self.via_fastpass.append(chapter)
+
+    def remove_fastpass(self, chapter: Chapter):
+        """
+        :raises ValueError: if chapter is not selected for fastpass
+        """
+        self.via_fastpass.remove(chapter)
+
     @property
     def coins_cost(self):
-        return sum([c.cost for c in self.via_coins])
+        return self._coins_cost
 
     @property
     def fastpass_cost(self):
         return len(self.via_fastpass)
+
+    @property
+    def coins_count(self):
+        return len(self.via_coins)
+
+    @property
+    def fastpass_count(self):
+        return len(self.via_fastpass)
+
+    @property
+    def count(self):
+        return len(self.via_coins) + len(self.via_fastpass)
@@ -1,7 +1,10 @@
+import heapq
+from contextlib import closing
 from typing import List, Callable
 
 from .analysis import Analysis
 from .interface import IAnalyser
+from .prefetch import prefetch_costs
 from ..api import ParsedApi
 from ..models import Profile, Chapter, Novel
 
@@ -17,92 +20,85 @@ class ForwardCrawl(IAnalyser):
     if [maximum_cost] is less than 0 it is considered as being infinite
     """
 
-    def __init__(self, novel: Novel, profile: Profile, maximum_cost=-1, on_load: Callable[[Chapter], None] = None):
+    def __init__(self, novel: Novel, profile: Profile, maximum_cost=-1, on_load: Callable[[Chapter], None] = None,
+                 workers: int = 8, lookahead: int = 16, api: ParsedApi = None):
         """
         :param novel: attribute id must not be null
         :param profile: webnovel profile, require [coins] and [fastpass]
         :param maximum_cost: maximum coins to spend a single chapter, maximum
         :param on_load: call when chapter is loaded
+        :param workers: maximum number of chapter costs requested concurrently
+        :param api: api used to request chapters, shared between analysers to reuse connections
+        :param lookahead: number of chapters requested ahead of the one being explored
         """
         self.novel = novel
         self.profile = profile
         self.maximum_cost = maximum_cost
+        self.workers = workers
+        self.lookahead = lookahead
 
         if on_load is None:
             self.on_load = lambda c: None
         else:
             self.on_load = on_load
 
-        self._api = ParsedApi()
+        if api is None:
+            self._api = ParsedApi()
+        else:
+            self._api = api
 
     def analyse(self, chapters: List[Chapter]) -> Analysis:
 
         coins = self.profile.coins
         fastpass = self.profile.fastpass
 
-        explored = []
-
-        # skip chapters count of fastpass
-        # each fastpass can unlock a chapter
-        # so length of fastpass can be unlocked
-        # if count is 3, start from index 3, item 4
-        i = fastpass
-
-        # iterate through fastpass count
-        for c in chapters[:i]:
-            chapter = self._api.chapter(self.novel.id, c.id)
-            self.on_load(chapter)
-
-            explored.append(chapter)
+        # the most expensive explored chapters are assigned to fastpass
+        # they are kept in a min heap so the cheapest of them is always on top
+        # entries are (cost, order, chapter) as chapters themselves are not comparable
+        fastpass_heap = []
+        via_coins = []
+        coins_cost = 0
 
-        while True:
-            # add new chapter
-            chapter = self._api.chapter(self.novel.id, chapters[i].id)
-            self.on_load(chapter)
+        with closing(prefetch_costs(chapters, self._fetch, self.workers, lookahead=self.lookahead)) as loaded:
+            for order, chapter in enumerate(loaded):
+                self.on_load(chapter)
 
-            explored.append(chapter)
+                entry = (chapter.cost, order, chapter)
 
-            # sort according to cost
-            explored.sort(key=lambda ch: ch.cost)
+                # each fastpass can unlock a chapter
+                # so the first chapters up to fastpass count are always unlockable
+                if len(fastpass_heap) < fastpass:
+                    heapq.heappush(fastpass_heap, entry)
+                    continue
 
-            # split such that the ones that cost most are assigned to fastpass
-            trial_coins, trial_fastpass = self._split(explored, fastpass)
+                # adding a chapter moves the cheapest of it and the fastpass chapters to coins
+                if fastpass_heap and fastpass_heap[0][0] < chapter.cost:
+                    demoted = fastpass_heap[0]
+                else:
+                    demoted = entry
 
-            # check if valid solution
-            total_trial_coins: int = sum([c.cost for c in trial_coins])
+                demoted_cost = demoted[0]
 
-            # if maximum cost is positive check chapters
-            # else maximum cost is regarded as being infinite.
-            overshooted = any([c.cost > self.maximum_cost for c in trial_coins]) if self.maximum_cost >= 0 else False
+                # if maximum cost is positive check chapters
+                # else maximum cost is regarded as being infinite.
+                # chapters never leave coins, so only the demoted chapter needs checking
+                overshooted = 0 <= self.maximum_cost < demoted_cost
 
-            # if not valid option
-            # previous solution must possible
-            # adding the last chapter caused solution to overshoot
-            # hence last solution must have maximum unlockable
-            if overshooted or coins < total_trial_coins:
-                # remove last added to get solution
-                explored.remove(chapter)
+                # adding this chapter causes the solution to overshoot
+                # hence the current solution has the maximum unlockable
+                if overshooted or coins < coins_cost + demoted_cost:
+                    break
 
-                # sort according to cost
-                explored.sort(key=lambda ch: ch.cost)
+                if demoted is not entry:
+                    heapq.heapreplace(fastpass_heap, entry)
 
-                # split such that the ones that cost most are assigned to fastpass
-                trial_coins, trial_fastpass = self._split(explored, fastpass)
+                via_coins.append(demoted[2])
+                coins_cost += demoted_cost
 
-                # return solution
-                return Analysis(via_coins=trial_coins, via_fastpass=trial_fastpass)
+        via_coins.sort(key=lambda ch: ch.cost)
+        via_fastpass = [entry[2] for entry in sorted(fastpass_heap)]
 
-            i += 1
+        return Analysis(via_coins=via_coins, via_fastpass=via_fastpass)
 
-    def _split(self, chapters: List, fastpass: int):
-        """
-        split chapters so that most expensive will be to fastpass
-
-        :param chapters: sorted chapters to split
-        :param fastpass: amount of fastpass
-        :return: coins, fastpass
-        """
-        if fastpass == 0:
-            return chapters, []
-        else:
-            return chapters[:-fastpass], chapters[-fastpass:]
+    def _fetch(self, chapter: Chapter) -> Chapter:
+        return self._api.probe(self.novel.id, chapter)
@@ -2,6 +2,7 @@ from typing import List, Callable
 
 from . import Analysis
 from .interface import IAnalyser
+from .prefetch import prefetch_costs
 from ..api import ParsedApi
 from ..models import Chapter, Novel, Profile
 
@@ -16,23 +17,30 @@ class Efficient(IAnalyser):
     if [maximum_cost] is less than 0 it is considered as being infinite
     """
 
-    def __init__(self, novel: Novel, profile: Profile, maximum_cost=-1, on_load: Callable[[Chapter], None] = None):
+    def __init__(self, novel: Novel, profile: Profile, maximum_cost=-1, on_load: Callable[[Chapter], None] = None,
+                 workers: int = 8, api: ParsedApi = None):
         """
         :param novel: attribute id must not be null
         :param profile: webnovel profile, require [coins] and [fastpass]
         :param maximum_cost: maximum coins to spend a single chapter, maximum
         :param on_load: call when chapter is loaded
+        :param workers: maximum number of chapter costs requested concurrently
+        :param api: api used to request chapters, shared between analysers to reuse connections
         """
         self.novel = novel
         self.profile = profile
         self.maximum_cost = maximum_cost
+        self.workers = workers
 
         if on_load is None:
             self.on_load = lambda c: None
         else:
             self.on_load = on_load
 
-        self._api = ParsedApi()
+        if api is None:
+            self._api = ParsedApi()
+        else:
+            self._api = api
 
     def analyse(self, chapters: List[Chapter]) -> Analysis:
 
@@ -42,11 +50,9 @@ class Efficient(IAnalyser):
         if coins <= 0 and fastpass <= 0:
             return Analysis.empty()
 
-        # get cost
-        for i in range(len(chapters)):
-            if chapters[i].cost is None:
-                chapters[i] = self._api.chapter(self.novel.id, chapters[i].id)
-            self.on_load(chapters[i])
+        # get cost, populated in place
+        for chapter in prefetch_costs(chapters, self._fetch, self.workers):
+            self.on_load(chapter)
 
         # sort according to cost
         chapters.sort(key=lambda c: c.cost)
@@ -57,12 +63,11 @@ class Efficient(IAnalyser):
         else:
             not_chosen, via_fastpass = chapters[:-fastpass], chapters[-fastpass:]
 
+        analysis = Analysis(via_coins=[], via_fastpass=via_fastpass)
+
         # get smallest possible coins cost to fit profile
-        via_coins: List[Chapter] = []
         for chapter in not_chosen:
-            total_cost = sum([c.cost for c in via_coins])
-
-            if total_cost + chapter.cost > coins:
+            if analysis.coins_cost + chapter.cost > coins:
                 break
 
             # maximum cost less than 0, means maximum cost is ignored
@@ -70,6 +75,9 @@ class Efficient(IAnalyser):
             if 0 <= self.maximum_cost < chapter.cost:
                 break
 
-            via_coins.append(chapter)
+            analysis.add_coins(chapter)
+
+        return analysis
 
-        return Analysis(via_coins=via_coins, via_fastpass=via_fastpass)
+    def _fetch(self, chapter: Chapter) -> Chapter:
+        return self._api.probe(self.novel.id, chapter)
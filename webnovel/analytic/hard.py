@@ -1,7 +1,9 @@
+from contextlib import closing
 from typing import List, Callable
 
 from . import Analysis
 from .interface import IAnalyser
+from .prefetch import prefetch_costs
 from ..api import ParsedApi
 from ..models import Chapter, Profile, Novel
 
@@ -14,7 +16,7 @@ class HardLine(IAnalyser):
     """
 
     def __init__(self, novel: Novel, profile: Profile, coins_line: int = None, fastpass_line: int = None,
-                 on_load: Callable[[Chapter], None] = None):
+                 on_load: Callable[[Chapter], None] = None, workers: int = 8, api: ParsedApi = None):
         """
         [fastpass_line] and [coins_line] are used to determine which is selected for which
 
@@ -22,6 +24,9 @@ class HardLine(IAnalyser):
         :param profile: webnovel profile, require [coins] and [fastpass]
         :param coins_line: chapters with cost less that or equal are selected for coins
         :param fastpass_line: chapters with cost greater than or equal are selected for fastpass
+        :param on_load: call when chapter is loaded
+        :param workers: maximum number of chapter costs requested concurrently
+        :param api: api used to request chapters, shared between analysers to reuse connections
         :raises ValueError: if [fastpass_line] is less than [coins_line] or if both lines are None
         """
         self.novel = novel
@@ -35,13 +40,17 @@ class HardLine(IAnalyser):
 
         self.fastpass_line = fastpass_line
         self.coins_line = coins_line
+        self.workers = workers
 
         if on_load is None:
             self.on_load = lambda c: None
         else:
             self.on_load = on_load
 
-        self._api = ParsedApi()
+        if api is None:
+            self._api = ParsedApi()
+        else:
+            self._api = api
 
     def analyse(self, chapters: List[Chapter]) -> Analysis:
 
@@ -53,32 +62,28 @@ class HardLine(IAnalyser):
         fastpass_maxed = self.fastpass_line is None or fastpass == 0
 
         analysis = Analysis.empty()
-        for chapter in chapters:
-
-            # making sure chapter has cost attribute populated
-            # if not requesting for chapter cost
-            if chapter.cost is None:
-                chapter = self._api.chapter(self.novel.id, chapter.id)
 
-            self.on_load(chapter)
+        # chapters are requested a little ahead of the one being distributed
+        # as distribution may stop before reaching the end
+        with closing(prefetch_costs(chapters, self._fetch, self.workers, lookahead=self.workers * 2)) as loaded:
+            for chapter in loaded:
+                self.on_load(chapter)
 
-            coins_cost = analysis.coins_cost
-            fastpass_cost = analysis.fastpass_cost
+                # distribute
+                if not coins_maxed:
+                    # check whether adding the chapter will exceed coins balance
+                    if analysis.coins_cost + chapter.cost <= coins and chapter.cost <= self.coins_line:
+                        analysis.add_coins(chapter)
 
-            # distribute
-            if not coins_maxed:
-                # check whether adding the chapter will exceed coins balance
-                if coins_cost + chapter.cost <= coins and chapter.cost <= self.coins_line:
-                    analysis.via_coins.append(chapter)
-                    coins_cost += chapter.cost
+                elif not fastpass_maxed and chapter.cost >= self.fastpass_line:
+                    analysis.add_fastpass(chapter)
 
-            elif not fastpass_maxed and chapter.cost >= self.fastpass_line:
-                analysis.via_fastpass.append(chapter)
+                    fastpass_maxed = fastpass == analysis.fastpass_cost
 
-                fastpass_cost += 1
-                fastpass_maxed = fastpass == fastpass_cost
-
-            if coins_maxed and fastpass_maxed:
-                break
+                if coins_maxed and fastpass_maxed:
+                    break
 
         return analysis
+
+    def _fetch(self, chapter: Chapter) -> Chapter:
+        return self._api.probe(self.novel.id, chapter)
@@ -0,0 +1,176 @@
+import heapq
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Callable, Tuple, Union
+
+from .analysis import Analysis
+from .interface import IAnalyser
+from .prefetch import prefetch_costs
+from ..api import ParsedApi
+from ..models import Chapter, Novel, Profile, ColumnarToc
+
+
+def any_plan(costs: List[int], coins: int, fastpass: int, maximum_cost=-1) -> Tuple[List[int], List[int]]:
+    """
+    maximum number of chapters unlockable in any order, spending the least coins
+
+    fastpass goes to the most expensive chapters and coins to the longest affordable run of
+    the cheapest remaining ones, found with a binary search over their prefix sums
+
+    :param costs: cost of each chapter
+    :param coins: coins available
+    :param fastpass: fastpass available
+    :param maximum_cost: maximum coins to spend a single chapter, infinite when less than 0
+    :return: indexes unlocked via coins, indexes unlocked via fastpass
+    """
+    order = sorted(range(len(costs)), key=costs.__getitem__)
+    fastpass = min(max(fastpass, 0), len(order))
+
+    # the cheapest chapters not taken by fastpass, in ascending cost
+    pool = order[:len(order) - fastpass]
+    pool_costs = [costs[i] for i in pool]
+
+    prefix = [0] + list(accumulate(pool_costs))
+    count = bisect_right(prefix, coins) - 1
+
+    if maximum_cost >= 0:
+        count = min(count, bisect_right(pool_costs, maximum_cost))
+
+    return pool[:count], order[len(order) - fastpass:]
+
+
+def contiguous_curve(costs: List[int], fastpass: int) -> Tuple[List[int], List[int]]:
+    """
+    least coins needed, and the most expensive chapter paid by coins, to unlock each prefix of [costs]
+
+    both lists are non decreasing, so the longest prefix fitting a budget is a binary search away
+
+    :param costs: cost of each chapter in order
+    :param fastpass: fastpass available
+    :return: spend, peak; where index i describes the first i chapters
+    """
+    spend = [0]
+    peak = [0]
+
+    # the most expensive chapters of the prefix are assigned to fastpass
+    fastpass_heap = []
+    for cost in costs:
+        if len(fastpass_heap) < fastpass:
+            heapq.heappush(fastpass_heap, cost)
+            demoted = 0
+        elif fastpass_heap and fastpass_heap[0] < cost:
+            demoted = heapq.heapreplace(fastpass_heap, cost)
+        else:
+            demoted = cost
+
+        spend.append(spend[-1] + demoted)
+        peak.append(max(peak[-1], demoted))
+
+    return spend, peak
+
+
+def contiguous_plan(costs: List[int], coins: int, fastpass: int, maximum_cost=-1) -> Tuple[List[int], List[int]]:
+    """
+    longest prefix of chapters unlockable, spending the least coins
+
+    :param costs: cost of each chapter in order
+    :param coins: coins available
+    :param fastpass: fastpass available
+    :param maximum_cost: maximum coins to spend a single chapter, infinite when less than 0
+    :return: indexes unlocked via coins, indexes unlocked via fastpass
+    """
+    fastpass = max(fastpass, 0)
+    spend, peak = contiguous_curve(costs, fastpass)
+
+    length = bisect_right(spend, coins) - 1
+    if maximum_cost >= 0:
+        length = min(length, bisect_right(peak, maximum_cost) - 1)
+
+    order = sorted(range(length), key=costs.__getitem__)
+    split = max(length - fastpass, 0)
+
+    return order[:split], order[split:]
+
+
+class Optimal(IAnalyser):
+    """
+    Calculate the allocation unlocking the most chapters, and among those the one spending the least coins
+     - cheaper chapters with coins
+     - expensive chapters with fastpass
+     - chapters unlocked using coins must not exceed [maximum_cost] individually
+     - if [contiguous], all chapters must be unlocked continuously from the first
+
+    if [maximum_cost] is less than 0 it is considered as being infinite
+
+    unlike the other analysers, the cost of every chapter is resolved before planning.
+    a ColumnarToc can be analysed in place of chapters, its locked chapters are considered
+    and Chapter objects are created only for those requested or selected
+    """
+
+    def __init__(self, novel: Novel, profile: Profile, maximum_cost=-1, contiguous=False,
+                 on_load: Callable[[Chapter], None] = None, workers: int = 8, api: ParsedApi = None):
+        """
+        :param novel: attribute id must not be null
+        :param profile: webnovel profile, require [coins] and [fastpass]
+        :param maximum_cost: maximum coins to spend a single chapter, maximum
+        :param contiguous: whether unlocked chapters must be continuous from the first
+        :param on_load: call when chapter is loaded
+        :param workers: maximum number of chapter costs requested concurrently
+        :param api: api used to request chapters, shared between analysers to reuse connections
+        """
+        self.novel = novel
+        self.profile = profile
+        self.maximum_cost = maximum_cost
+        self.contiguous = contiguous
+        self.workers = workers
+
+        if on_load is None:
+            self.on_load = lambda c: None
+        else:
+            self.on_load = on_load
+
+        if api is None:
+            self._api = ParsedApi()
+        else:
+            self._api = api
+
+    def analyse(self, chapters: Union[List[Chapter], ColumnarToc]) -> Analysis:
+        if isinstance(chapters, ColumnarToc):
+            return self._analyse_columnar(chapters)
+
+        loaded = []
+        for chapter in prefetch_costs(chapters, self._fetch, self.workers):
+            self.on_load(chapter)
+            loaded.append(chapter)
+
+        plan = contiguous_plan if self.contiguous else any_plan
+        via_coins, via_fastpass = plan(
+            [c.cost for c in loaded], self.profile.coins, self.profile.fastpass, self.maximum_cost
+        )
+
+        return Analysis(
+            via_coins=[loaded[i] for i in via_coins],
+            via_fastpass=[loaded[i] for i in via_fastpass],
+        )
+
+    def _analyse_columnar(self, toc: ColumnarToc) -> Analysis:
+        positions = toc.locked_positions()
+
+        # costs are written back into the table of contents
+        missing = [i for i in positions if toc.costs[i] < 0]
+        for i, chapter in zip(missing, prefetch_costs([toc.chapter(i) for i in missing], self._fetch, self.workers)):
+            self.on_load(chapter)
+            toc.costs[i] = chapter.cost
+
+        plan = contiguous_plan if self.contiguous else any_plan
+        via_coins, via_fastpass = plan(
+            [toc.costs[i] for i in positions], self.profile.coins, self.profile.fastpass, self.maximum_cost
+        )
+
+        return Analysis(
+            via_coins=[toc.chapter(positions[i]) for i in via_coins],
+            via_fastpass=[toc.chapter(positions[i]) for i in via_fastpass],
+        )
+
+    def _fetch(self, chapter: Chapter) -> Chapter:
+        return self._api.probe(self.novel.id, chapter)
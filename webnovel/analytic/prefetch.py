@@ -0,0 +1,58 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Iterable, Iterator, Callable
+
+from ..models import Chapter
+
+
+def prefetch_costs(chapters: Iterable[Chapter], fetch: Callable[[Chapter], Chapter], workers: int = 8,
+                   lookahead: int = None) -> Iterator[Chapter]:
+    """
+    resolve the chapters missing cost concurrently while yielding them in the given order
+
+    close the returned generator (or use `contextlib.closing`) when stopping early,
+    so that pending requests are cancelled
+
+    :param chapters: chapters whose cost may be None
+    :param fetch: called with a chapter missing cost, returns the chapter with cost populated
+    :param workers: maximum number of concurrent requests, 1 or less fetches serially
+    :param lookahead: maximum number of chapters requested ahead of the one yielded,
+                      when None all the chapters are requested immediately
+    :return: chapters in order, with cost populated
+    """
+    if workers <= 1:
+        for chapter in chapters:
+            yield fetch(chapter) if chapter.cost is None else chapter
+        return
+
+    if lookahead is not None:
+        lookahead = max(lookahead, 1)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    iterator = iter(chapters)
+    pending = deque()
+
+    def fill():
+        while lookahead is None or len(pending) < lookahead:
+            try:
+                chapter = next(iterator)
+            except StopIteration:
+                return
+
+            pending.append(executor.submit(fetch, chapter) if chapter.cost is None else chapter)
+
+    try:
+        fill()
+        while pending:
+            item = pending.popleft()
+
+            # keep the workers busy while waiting on the oldest request
+            fill()
+
+            yield item.result() if isinstance(item, Future) else item
+    finally:
+        for item in pending:
+            if isinstance(item, Future):
+                item.cancel()
+
+        executor.shutdown(wait=False)
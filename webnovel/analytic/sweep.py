@@ -0,0 +1,135 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import List, Iterable, Union
+
+from .optimal import contiguous_curve
+from ..lazy import optional_module
+from ..models import Chapter, ColumnarToc
+
+
+@dataclass
+class Scenario:
+    coins: int
+    fastpass: int
+    maximum_cost: int
+
+    unlocked: int
+    coins_spent: int
+    fastpass_spent: int
+
+
+class Sweep:
+    """
+    answers "how many chapters could be unlocked" for a whole grid of budgets at once
+
+    results are those of Efficient (or Optimal), and of ForwardCrawl when [contiguous].
+    costs are sorted and prefix summed once, every scenario is then a binary search.
+    when numpy is installed the grid is evaluated in a single vectorized pass
+    """
+
+    def __init__(self, costs: Union[Iterable[Union[int, Chapter]], ColumnarToc], contiguous=False):
+        """
+        :param costs: chapter costs, or chapters with cost populated, in chapter order.
+                      or a ColumnarToc, whose locked chapters are considered
+        :param contiguous: whether unlocked chapters must be continuous from the first
+        :raises ValueError: if a locked chapter of the ColumnarToc has unknown cost
+        """
+        if isinstance(costs, ColumnarToc):
+            self.costs = [costs.costs[i] for i in costs.locked_positions()]
+            if any(cost < 0 for cost in self.costs):
+                raise ValueError('costs of all locked chapters must be known')
+        else:
+            self.costs = [c.cost if isinstance(c, Chapter) else c for c in costs]
+        self.contiguous = contiguous
+
+        self._sorted = sorted(self.costs)
+        self._prefix = [0] + list(accumulate(self._sorted))
+
+        # curves of the contiguous objective depend on fastpass, they are built on demand
+        self._curves = {}
+
+    def table(self, coins: Iterable[int], fastpass: Iterable[int] = (0,),
+              maximum_cost: Iterable[int] = (-1,)) -> List[Scenario]:
+        """
+        :param coins: coin budgets to try
+        :param fastpass: fastpass budgets to try
+        :param maximum_cost: maximum coins to spend a single chapter, infinite when less than 0
+        :return: a scenario for every combination, ordered by coins, then fastpass, then maximum_cost
+        """
+        coins, fastpass, maximum_cost = list(coins), list(fastpass), list(maximum_cost)
+
+        if self.contiguous:
+            unlocked, spent = self._contiguous(coins, fastpass, maximum_cost)
+        elif optional_module('numpy') is None:
+            unlocked, spent = self._any(coins, fastpass, maximum_cost)
+        else:
+            unlocked, spent = self._any_vectorized(coins, fastpass, maximum_cost)
+
+        table = []
+        for i, c in enumerate(coins):
+            for j, f in enumerate(fastpass):
+                for k, m in enumerate(maximum_cost):
+                    count = int(unlocked[i][j][k])
+
+                    table.append(Scenario(
+                        coins=c,
+                        fastpass=f,
+                        maximum_cost=m,
+                        unlocked=count,
+                        coins_spent=int(spent[i][j][k]),
+                        fastpass_spent=min(max(f, 0), count),
+                    ))
+
+        return table
+
+    def _any(self, coins, fastpass, maximum_cost):
+        n = len(self._sorted)
+
+        affordable = [bisect_right(self._prefix, c) - 1 for c in coins]
+        pool = [n - min(max(f, 0), n) for f in fastpass]
+        capped = [n if m < 0 else bisect_right(self._sorted, m) for m in maximum_cost]
+
+        # chapters unlocked with coins
+        counts = [[[min(a, p, m) for m in capped] for p in pool] for a in affordable]
+
+        unlocked = [[[count + n - p for count in row] for p, row in zip(pool, plane)] for plane in counts]
+        spent = [[[self._prefix[count] for count in row] for row in plane] for plane in counts]
+
+        return unlocked, spent
+
+    def _any_vectorized(self, coins, fastpass, maximum_cost):
+        np = optional_module('numpy')
+
+        n = len(self._sorted)
+        prefix = np.asarray(self._prefix)
+        maximum_cost = np.asarray(maximum_cost)
+
+        affordable = np.searchsorted(prefix, np.asarray(coins), side='right') - 1
+        pool = n - np.clip(np.asarray(fastpass), 0, n)
+        capped = np.where(maximum_cost < 0, n, np.searchsorted(np.asarray(self._sorted), maximum_cost, side='right'))
+
+        # chapters unlocked with coins
+        counts = np.minimum(np.minimum(affordable[:, None, None], pool[None, :, None]), capped[None, None, :])
+
+        return counts + (n - pool)[None, :, None], prefix[counts]
+
+    def _contiguous(self, coins, fastpass, maximum_cost):
+        unlocked = [[[0] * len(maximum_cost) for _ in fastpass] for _ in coins]
+        spent = [[[0] * len(maximum_cost) for _ in fastpass] for _ in coins]
+
+        for j, f in enumerate(fastpass):
+            f = max(f, 0)
+            if f not in self._curves:
+                self._curves[f] = contiguous_curve(self.costs, f)
+
+            spend, peak = self._curves[f]
+            for i, c in enumerate(coins):
+                affordable = bisect_right(spend, c) - 1
+                for k, m in enumerate(maximum_cost):
+                    length = affordable if m < 0 else min(affordable, bisect_right(peak, m) - 1)
+
+                    unlocked[i][j][k] = length
+                    spent[i][j][k] = spend[length]
+
+        return unlocked, spent
@@ -1,3 +1,20 @@
-from .base import BaseApi
-from .html import HtmlApi
-from .parsed import UnlockType, ParsedApi
+from ..lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    'AsyncBaseApi': '.aio',
+    'AsyncParsedApi': '.aio',
+    'BaseApi': '.base',
+    'ChapterCache': '.cache',
+    'HtmlApi': '.html',
+    'UnlockType': '.parsed',
+    'ParsedApi': '.parsed',
+    'TransportPolicy': '.policy',
+    'AdaptiveLimit': '.policy',
+    'TokenBucket': '.policy',
+    'SessionPool': '.pool',
+    'default_pool': '.pool',
+    'set_default_pool': '.pool',
+    'PriceStore': '.prices',
+    'TocStore': '.store',
+    'TocDelta': '.store',
+})
@@ -0,0 +1,249 @@
+import asyncio
+import json
+from typing import Dict, List, Union, Iterable
+
+import aiohttp
+from requests.cookies import RequestsCookieJar
+
+from .base import BaseApi
+from .parsed import ParsedApi
+from ..models import Chapter
+
+
+class AsyncHtmlApi:
+    """
+    provide html pages asynchronously
+
+    to be used primarily with AsyncBaseApi.html
+    """
+
+    def __init__(self, api: 'AsyncBaseApi'):
+        """
+        :param api: api whose session and concurrency limit are used for requests
+        """
+        self.api = api
+
+    async def profile(self):
+        """
+        :return: user profile html
+        """
+        return await self.api.request(
+            'GET', f'https://www.webnovel.com/profile/{self.api.cookies.get("uid")}?appId=10'
+        )
+
+    async def vote(self):
+        """
+        :return: voting page html
+        """
+        return await self.api.request('GET', 'https://www.webnovel.com/vote')
+
+
+class AsyncBaseApi:
+    """
+    asyncio counterpart of BaseApi
+
+    at most [concurrency] requests are in flight at any moment,
+    the underlying session is created lazily inside the running event loop
+    """
+
+    def __init__(self, cookies: Union[RequestsCookieJar, List[dict], None] = None, *, concurrency: int = 16):
+        """
+        :param cookies: same as BaseApi
+        :param concurrency: maximum number of simultaneous requests
+        """
+        if concurrency < 1:
+            raise ValueError('[concurrency] must be at least 1')
+
+        self.has_cookies = bool(cookies)
+        self.concurrency = concurrency
+
+        # set cookies
+        if type(cookies) == RequestsCookieJar:
+            self.cookies = {cookie.name: cookie.value for cookie in cookies}
+        elif type(cookies) == list:
+            self.cookies = {cookie['name']: cookie['value'] for cookie in cookies}
+        elif cookies is None:
+            self.cookies = {}
+        else:
+            raise TypeError("'cookies' was of unrecognized type; must be (RequestsCookieJar, List[dict cookie], None)")
+
+        self.session = None
+        self._semaphore = None
+
+        # html api
+        self.html = AsyncHtmlApi(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, method: str, url: str, **kwargs) -> bytes:
+        """
+        :return: raw body of the response
+        """
+        if self.session is None:
+            # as cookies can lead to a rejected response
+            # they are all blocked when none are given
+            if self.has_cookies:
+                cookie_jar = aiohttp.CookieJar()
+                cookie_jar.update_cookies(self.cookies)
+            else:
+                cookie_jar = aiohttp.DummyCookieJar()
+
+            self.session = aiohttp.ClientSession(cookie_jar=cookie_jar)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            async with self.session.request(method, url, **kwargs) as response:
+                return await response.read()
+
+    async def chapter(self, novel_id: int, chapter_id: int) -> Dict:
+        content = await self.request(
+            'GET',
+            'https://www.webnovel.com/go/pcm/chapter/getContent',
+            params={
+                '_csrfToken': self._csrf_token(),
+                'bookId': str(novel_id),
+                'chapterId': str(chapter_id)
+            }
+        )
+
+        return BaseApi.validate_content(content)
+
+    async def toc(self, novel_id: int) -> Dict:
+        content = await self.request(
+            'GET',
+            'https://www.webnovel.com/apiajax/chapter/GetChapterList',
+            params={
+                '_csrfToken': self._csrf_token(),
+                'bookId': str(novel_id),
+            }
+        )
+
+        return BaseApi.validate_content(content)
+
+    async def unlock(self, novel_id: int, chapters: List[Dict], unlock_type: int):
+        """
+        Unlocks chapters provided with method specified
+
+        Requires cookies
+
+        :param novel_id: id of novel
+        :param chapters: see BaseApi.unlock
+        :param unlock_type: 3 to unlock with coins | 5 to unlock with fastpass
+        """
+        content = await self.request(
+            'POST',
+            'https://www.webnovel.com/apiajax/SpiritStone/useSSAjax',
+            data={
+                '_csrfToken': self._csrf_token(),
+                'bookId': str(novel_id),
+                'chapters': json.dumps(chapters),
+                'unlockType': str(unlock_type)
+            }
+        )
+
+        return BaseApi.validate_content(content)
+
+    async def power_vote(self, novel_id):
+        """
+        Applies single power stone vote to novel
+
+        Requires cookies
+
+        :param novel_id: novel to vote
+        """
+        content = await self.request(
+            'POST',
+            'https://www.webnovel.com/apiajax/powerStone/vote',
+            data={
+                '_csrfToken': self._csrf_token(),
+                'bookId': str(novel_id),
+                'novelType': '0'
+            }
+        )
+
+        return BaseApi.validate_content(content)
+
+    async def energy_vote(self, novel_id):
+        """
+        Applies single energy stone vote to translation novel release queue
+
+        Requires cookies
+
+        :param novel_id: novel to vote
+        """
+        content = await self.request(
+            'POST',
+            'https://www.webnovel.com/apiajax/translationVote/vote',
+            data={
+                '_csrfToken': self._csrf_token(),
+                'bookId': str(novel_id)
+            }
+        )
+
+        return BaseApi.validate_content(content)
+
+    def _csrf_token(self) -> str:
+        return self.cookies.get('_csrfToken', '') if self.has_cookies else ''
+
+
+class AsyncParsedApi(AsyncBaseApi):
+    """
+    asyncio counterpart of ParsedApi, returns the same models
+
+    example usage:
+
+        async with AsyncParsedApi(cookies, concurrency=32) as api:
+            toc = await api.toc(novel_id)
+            chapters = await api.chapters(novel_id, [c.id for c in toc['Volume 1']])
+
+    """
+
+    async def toc(self, novel_id) -> Dict[str, List[Chapter]]:
+        response = await super().toc(novel_id)
+
+        return ParsedApi.parse_toc(novel_id, response)
+
+    async def chapter(self, novel_id, chapter_id) -> Chapter:
+        response = await super().chapter(novel_id, chapter_id)
+
+        return ParsedApi.parse_chapter(novel_id, chapter_id, response)
+
+    async def probe(self, novel_id, chapter: Chapter) -> Chapter:
+        """
+        see ParsedApi.probe
+        """
+        response = await super().chapter(novel_id, chapter.id)
+
+        return ParsedApi.parse_probe(chapter, response)
+
+    async def chapters(self, novel_id, chapter_ids: Iterable[int]) -> List[Chapter]:
+        """
+        fetch many chapters concurrently, bounded by [concurrency]
+
+        :param novel_id: corresponding novel
+        :param chapter_ids: ids of chapters to fetch
+        :return: chapters in the order of [chapter_ids]
+        """
+        return list(await asyncio.gather(*[self.chapter(novel_id, chapter_id) for chapter_id in chapter_ids]))
+
+    async def unlock(self, novel_id: int, chapter: Chapter, unlock_type: int) -> Chapter:
+        """
+        Unlocks chapters provided with options specified
+
+        :param novel_id: corresponding novel
+        :param chapter: chapter to unlock
+        :param unlock_type: use UnlockType attributes to get correct ints
+        :return: unlocked chapters
+        """
+        response = await super().unlock(novel_id, ParsedApi.unlock_form(chapter, unlock_type), unlock_type)
+
+        return ParsedApi.parse_unlock(chapter, response)
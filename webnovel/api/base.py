@@ -5,7 +5,10 @@ import requests
 from requests.cookies import RequestsCookieJar
 
 from .cookie import BlockAll
+from .decode import validate
 from .html import HtmlApi
+from .policy import TransportPolicy
+from .pool import SessionPool, default_pool
 from ..exceptions import ApiError
 
 
@@ -14,8 +17,22 @@ class BaseApi:
     Creates direct requests to data api rather than to load web page
     """
 
-    def __init__(self, cookies: Union[RequestsCookieJar, List[dict], None] = None):
-        self.session = requests.Session()
+    def __init__(self, cookies: Union[RequestsCookieJar, List[dict], None] = None, *, policy: TransportPolicy = None,
+                 pool: SessionPool = None):
+        """
+        :param cookies: cookies of a signed in session, or None to make requests without any
+        :param policy: rate limiting, retries and concurrency of requests, share it to share the limits
+        :param pool: pool whose connections are used, the process wide pool by default
+        """
+        if policy is None:
+            self.policy = TransportPolicy()
+        else:
+            self.policy = policy
+
+        if pool is None:
+            pool = default_pool()
+
+        self.session = pool.session()
         self.has_cookies = bool(cookies)
 
         # set cookies
@@ -34,11 +51,11 @@ class BaseApi:
             raise TypeError("'cookies' was of unrecognized type; must be (RequestsCookieJar, List[dict cookie], None)")
 
         # html api
-        self.html = HtmlApi(self.session)
+        self.html = HtmlApi(self.session, self.policy)
 
     def chapter(self, novel_id: int, chapter_id: int) -> Dict:
-        response = self.session.get(
-            'https://www.webnovel.com/go/pcm/chapter/getContent',
+        return self.request(
+            'GET', 'https://www.webnovel.com/go/pcm/chapter/getContent',
             params={
                 '_csrfToken': self.session.cookies.get('_csrfToken') if self.has_cookies else '',
                 'bookId': novel_id,
@@ -46,19 +63,15 @@ class BaseApi:
             }
         )
 
-        return self.validate(response)
-
     def toc(self, novel_id: int) -> Dict:
-        response = self.session.get(
-            'https://www.webnovel.com/apiajax/chapter/GetChapterList',
+        return self.request(
+            'GET', 'https://www.webnovel.com/apiajax/chapter/GetChapterList',
             params={
                 '_csrfToken': self.session.cookies.get('_csrfToken') if self.has_cookies else '',
                 'bookId': novel_id,
             }
         )
 
-        return self.validate(response)
-
     def unlock(self, novel_id: int, chapters: List[Dict], unlock_type: int):
         """
         Unlocks chapters provided with method specified
@@ -75,8 +88,8 @@ class BaseApi:
         :return:
         """
 
-        response = self.session.post(
-            'https://www.webnovel.com/apiajax/SpiritStone/useSSAjax',
+        return self.request(
+            'POST', 'https://www.webnovel.com/apiajax/SpiritStone/useSSAjax',
             data={
                 '_csrfToken': self.session.cookies.get('_csrfToken') if self.has_cookies else '',
                 'bookId': novel_id,
@@ -85,8 +98,6 @@ class BaseApi:
             }
         )
 
-        return self.validate(response)
-
     def power_vote(self, novel_id):
         """
         Applies single power stone vote to novel
@@ -96,8 +107,8 @@ class BaseApi:
         :param novel_id: novel to vote
         :return: Response
         """
-        response = self.session.post(
-            'https://www.webnovel.com/apiajax/powerStone/vote',
+        return self.request(
+            'POST', 'https://www.webnovel.com/apiajax/powerStone/vote',
             data={
                 '_csrfToken': self.session.cookies.get('_csrfToken') if self.has_cookies else '',
                 'bookId': novel_id,
@@ -105,8 +116,6 @@ class BaseApi:
             }
         )
 
-        return self.validate(response)
-
     def energy_vote(self, novel_id):
         """
         Applies single energy stone vote to translation novel release queue
@@ -116,25 +125,37 @@ class BaseApi:
         :param novel_id: novel to vote
         :return: Response
         """
-        response = self.session.post(
-            'https://www.webnovel.com/apiajax/translationVote/vote',
+        return self.request(
+            'POST', 'https://www.webnovel.com/apiajax/translationVote/vote',
             data={
                 '_csrfToken': self.session.cookies.get('_csrfToken') if self.has_cookies else '',
                 'bookId': novel_id
             }
         )
 
-        return self.validate(response)
+    def request(self, method: str, url: str, idempotent: bool = None, **kwargs) -> Dict:
+        """
+        issue a request under [policy] and validate the response
+
+        :param idempotent: whether the request can be retried after it may have been handled,
+         by default true of GET requests only, see TransportPolicy
+        :raises ApiError: if the request failed permanently or ran out of retries
+        :return: parsed response
+        """
+        return self.policy.send(self.session, method, url, self.validate, idempotent, **kwargs)
 
     def validate(self, response) -> Dict:
-        parsed = json.loads(response.content)
-        try:
-            # code 0 denotes a successful response
-            if parsed['code'] != 0:
-                raise ApiError(parsed['msg'])
+        # error pages are not json
+        if not response.ok:
+            raise ApiError(f'{response.status_code} {response.reason}', status=response.status_code)
 
-        # for instances it doesnt return any data
-        except KeyError:
-            raise ApiError('no data was returned')
+        return self.validate_content(response.content)
 
-        return parsed
+    @staticmethod
+    def validate_content(content) -> Dict:
+        """
+        :param content: raw json body of an api response
+        :raises ApiError: if the response denotes a failure
+        :return: parsed response
+        """
+        return validate(content)
@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from ..models import Chapter
+
+
+class ChapterCache:
+    """
+    sqlite backed cache of parsed chapters, keyed by novel id and chapter id
+
+    locked chapters (whose price may change) and unlocked chapters (whose content does not)
+    expire separately. when more than [max_entries] are stored the least recently used are evicted.
+
+    whether a chapter is locked depends on the account, so a cache should not be shared between accounts
+
+    example usage:
+
+        api = ParsedApi(cookies, cache=ChapterCache('chapters.sqlite'))
+
+    """
+
+    def __init__(self, path: str = ':memory:', locked_ttl: Optional[float] = 24 * 60 * 60,
+                 unlocked_ttl: Optional[float] = None, max_entries: int = 10000):
+        """
+        :param path: sqlite database file, kept in memory by default
+        :param locked_ttl: seconds a locked chapter is kept, None to keep indefinitely
+        :param unlocked_ttl: seconds an unlocked chapter is kept, None to keep indefinitely
+        :param max_entries: maximum number of chapters kept
+        """
+        self.locked_ttl = locked_ttl
+        self.unlocked_ttl = unlocked_ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        # analysers request chapters from several threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS chapters (
+                novel_id TEXT NOT NULL,
+                chapter_id TEXT NOT NULL,
+                no INTEGER,
+                id,
+                title TEXT,
+                paragraphs TEXT,
+                locked INTEGER,
+                cost INTEGER,
+                type INTEGER,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (novel_id, chapter_id)
+            );
+            CREATE INDEX IF NOT EXISTS chapters_accessed_at ON chapters (accessed_at);
+        ''')
+
+    def get(self, novel_id, chapter_id) -> Optional[Chapter]:
+        """
+        :return: cached chapter, None if missing or expired
+        """
+        key = (str(novel_id), str(chapter_id))
+        now = time.time()
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT no, id, title, paragraphs, locked, cost, type, stored_at FROM chapters '
+                'WHERE novel_id = ? AND chapter_id = ?', key
+            ).fetchone()
+
+            if row is not None:
+                no, id, title, paragraphs, locked, cost, type, stored_at = row
+
+                ttl = self.locked_ttl if locked else self.unlocked_ttl
+                if ttl is not None and now - stored_at > ttl:
+                    self._connection.execute('DELETE FROM chapters WHERE novel_id = ? AND chapter_id = ?', key)
+                    row = None
+                else:
+                    self._connection.execute(
+                        'UPDATE chapters SET accessed_at = ? WHERE novel_id = ? AND chapter_id = ?', (now, *key)
+                    )
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return Chapter(
+            no=no,
+            id=id,
+            url=f'https://www.webnovel.com/book/{novel_id}/{chapter_id}',
+            title=title,
+            paragraphs=json.loads(paragraphs),
+            locked=None if locked is None else bool(locked),
+            cost=cost,
+            type=type,
+        )
+
+    def put(self, novel_id, chapter: Chapter):
+        """
+        store [chapter], replacing any previous entry
+        """
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO chapters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                    str(novel_id), str(chapter.id), chapter.no, chapter.id, chapter.title,
+                    json.dumps(chapter.paragraphs), chapter.locked, chapter.cost, chapter.type, now, now,
+                )
+            )
+
+            # evict least recently used
+            count, = self._connection.execute('SELECT COUNT(*) FROM chapters').fetchone()
+            if count > self.max_entries:
+                self._connection.execute(
+                    'DELETE FROM chapters WHERE rowid IN '
+                    '(SELECT rowid FROM chapters ORDER BY accessed_at LIMIT ?)', (count - self.max_entries,)
+                )
+
+    def remove(self, novel_id, chapter_id):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM chapters WHERE novel_id = ? AND chapter_id = ?', (str(novel_id), str(chapter_id))
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM chapters')
+
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM chapters').fetchone()[0]
@@ -0,0 +1,34 @@
+import json
+from typing import Dict
+
+from ..exceptions import ApiError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+else:
+    loads = json.loads
+
+
+def validate(content) -> Dict:
+    """
+    :param content: raw json body of an api response
+    :raises ApiError: if the response denotes a failure
+    :return: parsed response
+    """
+    parsed = loads(content)
+    try:
+        # code 0 denotes a successful response
+        if parsed['code'] != 0:
+            raise ApiError(parsed.get('msg'), code=parsed['code'])
+
+    # for instances it doesnt return any data
+    except KeyError:
+        raise ApiError('no data was returned')
+
+    return parsed
+
@@ -1,4 +1,7 @@
-from requests import Session
+from requests import Session, Response
+
+from .policy import TransportPolicy
+from ..exceptions import ApiError
 
 
 class HtmlApi:
@@ -8,27 +11,49 @@ class HtmlApi:
     to be used primarily with BaseApi.html
     """
 
-    def __init__(self, session: Session = None):
+    def __init__(self, session: Session = None, policy: TransportPolicy = None):
         """
         :param session: session to use for requests
+        :param policy: timeout, retries and concurrency of requests, see BaseApi
         """
         if session is None:
             self.session = Session()
         else:
             self.session = session
 
+        if policy is None:
+            self.policy = TransportPolicy()
+        else:
+            self.policy = policy
+
     def profile(self):
         """
         :return: user profile html
         """
-        return self.session.get(
-            f'https://www.webnovel.com/profile/{self.session.cookies.get("uid")}?appId=10'
-        ).content
+        return self.get(f'https://www.webnovel.com/profile/{self.session.cookies.get("uid")}?appId=10')
+
+    def novel(self, novel_id):
+        """
+        :return: novel page html
+        """
+        return self.get(f'https://www.webnovel.com/book/{novel_id}')
 
     def vote(self):
         """
         :return: voting page html
         """
-        return self.session.get(
-            'https://www.webnovel.com/vote'
-        ).content
+        return self.get('https://www.webnovel.com/vote')
+
+    def get(self, url: str) -> bytes:
+        """
+        :raises ApiError: if the page could not be loaded
+        :return: html of the page at [url]
+        """
+        return self.policy.send(self.session, 'GET', url, self.validate)
+
+    @staticmethod
+    def validate(response: Response) -> bytes:
+        if not response.ok:
+            raise ApiError(f'{response.status_code} {response.reason}', status=response.status_code)
+
+        return response.content
@@ -1,9 +1,15 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 
-from bs4 import BeautifulSoup
+from requests.cookies import RequestsCookieJar
 
 from .base import BaseApi
-from ..models import Chapter
+from .cache import ChapterCache
+from .policy import TransportPolicy
+from .pool import SessionPool
+from .prices import PriceStore
+from ..exceptions import UnlockError
+from ..models import Chapter, ColumnarToc
+from ..tools import TextTools
 
 
 class UnlockType:
@@ -12,32 +18,252 @@ class UnlockType:
 
 
 class ParsedApi(BaseApi):
+    def __init__(self, cookies: Union[RequestsCookieJar, List[dict], None] = None, *, cache: ChapterCache = None,
+                 policy: TransportPolicy = None, pool: SessionPool = None, prices: PriceStore = None):
+        """
+        :param cookies: see BaseApi
+        :param cache: when given, chapters are served from and stored to it
+        :param policy: see BaseApi
+        :param pool: see BaseApi
+        :param prices: when given, observed prices are recorded to it and
+                       known prices are used instead of probing the chapter
+        """
+        super().__init__(cookies, policy=policy, pool=pool)
+
+        self.cache = cache
+        self.prices = prices
+
     def toc(self, novel_id) -> Dict[str, List[Chapter]]:
         response = super().toc(novel_id)
 
+        volumes = self.parse_toc(novel_id, response)
+
+        if self.prices is not None:
+            self._record_toc_prices(novel_id, response)
+
+            known = self.prices.get_novel(novel_id)
+            for chapters in volumes.values():
+                for chapter in chapters:
+                    chapter.cost = known.get(int(chapter.id))
+
+        return volumes
+
+    def columnar_toc(self, novel_id) -> ColumnarToc:
+        """
+        table of contents as parallel arrays, without creating a Chapter for each chapter
+        """
+        response = super().toc(novel_id)
+
+        toc = self.parse_columnar_toc(novel_id, response)
+
+        if self.prices is not None:
+            self._record_toc_prices(novel_id, response)
+
+            known = self.prices.get_novel(novel_id)
+            for i, chapter_id in enumerate(toc.ids):
+                if toc.costs[i] < 0 and chapter_id in known:
+                    toc.costs[i] = known[chapter_id]
+
+        return toc
+
+    def chapter(self, novel_id, chapter_id) -> Chapter:
+        if self.cache is not None:
+            chapter = self.cache.get(novel_id, chapter_id)
+            if chapter is not None:
+                return chapter
+
+        response = super().chapter(novel_id, chapter_id)
+
+        chapter = self.parse_chapter(novel_id, chapter_id, response)
+
+        if self.cache is not None:
+            self.cache.put(novel_id, chapter)
+        if self.prices is not None:
+            self.prices.put(novel_id, chapter.id, chapter.cost)
+
+        return chapter
+
+    def probe(self, novel_id, chapter: Chapter) -> Chapter:
+        """
+        populate price details of [chapter] in place, without keeping any of its content
+
+        only cost, locked and type are updated, the response is dropped as soon as they are read,
+        so probing many chapters does not hold on to their preview text
+
+        when a price store is given and knows the price, only cost is updated and no request is made
+
+        :param novel_id: novel the chapter belongs to
+        :param chapter: chapter whose price details are requested
+        :return: [chapter]
+        """
+        if self.prices is not None:
+            cost = self.prices.get(novel_id, chapter.id)
+            if cost is not None:
+                chapter.cost = cost
+                return chapter
+
+        if self.cache is not None:
+            cached = self.cache.get(novel_id, chapter.id)
+            if cached is not None:
+                chapter.cost, chapter.locked, chapter.type = cached.cost, cached.locked, cached.type
+                return chapter
+
+        response = super().chapter(novel_id, chapter.id)
+
+        self.parse_probe(chapter, response)
+
+        if self.prices is not None:
+            self.prices.put(novel_id, chapter.id, chapter.cost)
+
+        return chapter
+
+    def unlock(self, novel_id: int, chapter: Chapter, unlock_type: int) -> Chapter:
+        """
+        Unlocks chapters provided with options specified
+
+        :param novel_id: corresponding novel
+        :param chapter: chapter to unlock
+        :param unlock_type: use UnlockType attributes to get correct ints
+        :return: unlocked chapters
+        """
+        response = super().unlock(novel_id, self.unlock_form(chapter, unlock_type), unlock_type)
+
+        # cached entry is of the locked chapter
+        if self.cache is not None:
+            self.cache.remove(novel_id, chapter.id)
+
+        return self.parse_unlock(chapter, response)
+
+    def unlock_many(self, novel_id: int, chapters: List[Chapter], unlock_type: int,
+                    batch_size: int = 50) -> List[Chapter]:
+        """
+        Unlocks chapters of a novel with options specified, [batch_size] chapters per request
+
+        :param novel_id: corresponding novel
+        :param chapters: chapters to unlock, all of the same novel
+        :param unlock_type: use UnlockType attributes to get correct ints
+        :param batch_size: maximum number of chapters unlocked by a single request
+        :raises UnlockError: if a request fails, with the chapters unlocked before it
+        :return: unlocked chapters
+        """
+        if batch_size < 1:
+            raise ValueError('[batch_size] must be at least 1')
+
+        unlocked = []
+        try:
+            for start in range(0, len(chapters), batch_size):
+                batch = chapters[start:start + batch_size]
+                form_data = [item for chapter in batch for item in self.unlock_form(chapter, unlock_type)]
+
+                response = super().unlock(novel_id, form_data, unlock_type)
+                unlocked.extend(batch)
+
+                if self.cache is not None:
+                    for chapter in batch:
+                        self.cache.remove(novel_id, chapter.id)
+
+                # paragraphs of a locked chapter are a preview, replaced by the unlocked content
+                for chapter in batch:
+                    chapter.paragraphs = None
+
+                self.parse_unlock_many(batch, response)
+
+            # contents not told apart by chapter are read once unlocked
+            for chapter in unlocked:
+                if chapter.paragraphs is None:
+                    chapter.paragraphs = self.chapter(novel_id, chapter.id).paragraphs
+
+        except Exception as e:
+            raise UnlockError(
+                f'unlocked {len(unlocked)} of {len(chapters)} chapters: {e}',
+                code=getattr(e, 'code', None), status=getattr(e, 'status', None),
+                unlocked=unlocked, pending=chapters[len(unlocked):],
+            ) from e
+
+        return chapters
+
+    def _record_toc_prices(self, novel_id, response: Dict):
+        # price is only known when the chapter list carries it
+        self.prices.put_many(novel_id, (
+            (item['id'], item['price'])
+            for volume_item in response['data']['volumeItems']
+            for item in volume_item['chapterItems'] if item.get('price') is not None
+        ))
+
+    @staticmethod
+    def parse_toc(novel_id, response: Dict) -> Dict[str, List[Chapter]]:
+        """
+        :param novel_id: novel the table of contents belongs to
+        :param response: validated response of BaseApi.toc
+        :return: dict of volumes in order, where key is volume name and value the chapters
+        """
         volume_items = response['data']['volumeItems']
 
         volumes = {}
         for volume_item in volume_items:
-            chapters = [
-                Chapter(
-                    no=item['index'],
-                    id=item['id'],
-                    url=f'https://www.webnovel.com/book/{novel_id}/{item["id"]}',
-                    title=item['name'],
-                    locked=not int(item['isAuth']),
-                ) for item in volume_item['chapterItems']
-            ]
-
-            _name = volume_item['name']
-            volume_name = f'Volume {volume_item["index"]}' + (f': {_name}' if _name else '')
-            volumes[volume_name] = chapters
+            chapters = [ParsedApi.parse_toc_item(novel_id, item) for item in volume_item['chapterItems']]
+
+            volumes[ParsedApi.parse_volume_name(volume_item)] = chapters
 
         return volumes
 
-    def chapter(self, novel_id, chapter_id) -> Chapter:
-        response = super().chapter(novel_id, chapter_id)
+    @staticmethod
+    def parse_columnar_toc(novel_id, response: Dict) -> ColumnarToc:
+        """
+        :param novel_id: novel the table of contents belongs to
+        :param response: validated response of BaseApi.toc
+        :return: table of contents as parallel arrays
+        """
+        ids, indices, locked, costs = [], [], [], []
+        volume_names, volume_offsets = [], []
+
+        for volume_item in response['data']['volumeItems']:
+            volume_names.append(ParsedApi.parse_volume_name(volume_item))
+            volume_offsets.append(len(ids))
+
+            for item in volume_item['chapterItems']:
+                ids.append(int(item['id']))
+                indices.append(item['index'])
+                locked.append(0 if int(item['isAuth']) else 1)
+
+                # price is only known when the chapter list carries it
+                price = item.get('price')
+                costs.append(-1 if price is None else price)
+
+        return ColumnarToc(novel_id, ids, indices, locked, costs, volume_names, volume_offsets)
+
+    @staticmethod
+    def parse_toc_item(novel_id, item: Dict) -> Chapter:
+        """
+        :param novel_id: novel the chapter belongs to
+        :param item: chapter item of a volume in BaseApi.toc response
+        :return: Chapter object
+        """
+        return Chapter(
+            no=item['index'],
+            id=item['id'],
+            url=f'https://www.webnovel.com/book/{novel_id}/{item["id"]}',
+            title=item['name'],
+            locked=not int(item['isAuth']),
+        )
 
+    @staticmethod
+    def parse_volume_name(volume_item: Dict) -> str:
+        """
+        :param volume_item: volume item in BaseApi.toc response
+        :return: display name of the volume
+        """
+        _name = volume_item['name']
+        return f'Volume {volume_item["index"]}' + (f': {_name}' if _name else '')
+
+    @staticmethod
+    def parse_chapter(novel_id, chapter_id, response: Dict) -> Chapter:
+        """
+        :param novel_id: novel the chapter belongs to
+        :param chapter_id: id of the chapter
+        :param response: validated response of BaseApi.chapter
+        :return: Chapter object
+        """
         data = response['data']['chapterInfo']
 
         return Chapter(
@@ -45,34 +271,73 @@ class ParsedApi(BaseApi):
             id=data['chapterId'],
             title=data['chapterName'],
             url=f'https://www.webnovel.com/book/{novel_id}/{chapter_id}',
-            paragraphs=[para['content'] for para in data['contents']],
+            paragraphs=TextTools.paragraphs(data['contents']),
             cost=data['price'],
             locked=not int(data['isAuth']),
             type=int(data['chapterLevel']),
         )
 
-    def unlock(self, novel_id: int, chapter: Chapter, unlock_type: int) -> Chapter:
+    @staticmethod
+    def parse_probe(chapter: Chapter, response: Dict) -> Chapter:
         """
-        Unlocks chapters provided with options specified
+        :param chapter: chapter that was probed
+        :param response: validated response of BaseApi.chapter
+        :return: chapter with cost, locked and type updated
+        """
+        data = response['data']['chapterInfo']
 
-        :param novel_id: corresponding novel
+        chapter.cost = data['price']
+        chapter.locked = not int(data['isAuth'])
+        chapter.type = int(data['chapterLevel'])
+
+        return chapter
+
+    @staticmethod
+    def unlock_form(chapter: Chapter, unlock_type: int) -> List[Dict]:
+        """
         :param chapter: chapter to unlock
         :param unlock_type: use UnlockType attributes to get correct ints
-        :return: unlocked chapters
+        :return: viable form data for BaseApi.unlock
         """
-
-        # check and convert to viable form data
-        form_data = [{
+        return [{
             'chapterPrice': chapter.cost if unlock_type == UnlockType.coins else 1,
             'chapterId': str(chapter.id),
             'chapterType': 2  # no idea why its 2, but it seems to work
         }]
 
-        response = super().unlock(novel_id, form_data, unlock_type)
-
+    @staticmethod
+    def parse_unlock(chapter: Chapter, response: Dict) -> Chapter:
+        """
+        :param chapter: chapter that was unlocked
+        :param response: validated response of BaseApi.unlock
+        :return: chapter with paragraph data updated
+        """
         data = response['data']
 
         # update paragraph data
-        chapter.paragraphs = [BeautifulSoup(para['content'], 'lxml').text for para in data['contents']]
+        chapter.paragraphs = TextTools.paragraphs(data['contents'])
 
         return chapter
+
+    @staticmethod
+    def parse_unlock_many(chapters: List[Chapter], response: Dict) -> List[Chapter]:
+        """
+        contents of several chapters are told apart by the chapter id of each paragraph,
+        chapters whose paragraphs cannot be identified are left as is, ParsedApi.unlock_many reads them again
+
+        :param chapters: chapters that were unlocked together
+        :param response: validated response of BaseApi.unlock
+        :return: chapters with paragraph data updated
+        """
+        if len(chapters) == 1:
+            return [ParsedApi.parse_unlock(chapters[0], response)]
+
+        contents = {}
+        for para in response['data']['contents']:
+            contents.setdefault(str(para.get('chapterId')), []).append(para)
+
+        for chapter in chapters:
+            if str(chapter.id) in contents:
+                chapter.paragraphs = TextTools.paragraphs(contents[str(chapter.id)])
+
+        return chapters
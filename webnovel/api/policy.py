@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional, Callable, Any
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ..exceptions import ApiError
+
+
+class TokenBucket:
+    """
+    allows [rate] requests per second on average, in bursts of up to [burst]
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        take a token, going into debt if none is available
+
+        :return: seconds to wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+
+class AdaptiveLimit:
+    """
+    concurrency limit adjusted with additive increase, multiplicative decrease
+
+    every success raises the limit by [increase] / limit (about [increase] per round of requests),
+    every throttled response multiplies it by [decrease]
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 64, increase: float = 1.0,
+                 decrease: float = 0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+
+        self.limit = float(initial)
+        self.active = 0
+
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """
+        hold one of the slots allowed by the current limit
+        """
+        with self._condition:
+            while self.active >= int(self.limit):
+                self._condition.wait()
+
+            self.active += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.active -= 1
+                self._condition.notify()
+
+    def succeeded(self):
+        with self._condition:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self._condition.notify_all()
+
+    def throttled(self):
+        with self._condition:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+
+
+class TransportPolicy:
+    """
+    how BaseApi issues its requests
+
+     - requests to a host are paced by a token bucket when [rate] is given
+     - transient failures are retried up to [retries] times, with exponential backoff and full jitter
+     - concurrent requests are bounded by an adaptive limit that backs off when throttled
+
+    connection errors, timeouts, [transient_status] responses and api errors with [transient_codes]
+    are transient. [throttle_status] responses and api errors with [throttle_codes] are transient
+    and also reduce concurrency. every other failure is permanent and raised immediately.
+
+    requests which are not idempotent, such as unlocking a chapter or voting, may have been handled
+    even when they failed, so they are only retried when they never reached the server:
+    the connection could not be made, or the response was [rejected_status]
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1, retries: int = 3, backoff: float = 0.5,
+                 max_backoff: float = 30.0, timeout: Optional[float] = 30.0, concurrency: AdaptiveLimit = None,
+                 throttle_status: Iterable[int] = (429, 503), transient_status: Iterable[int] = (500, 502, 504),
+                 throttle_codes: Iterable[int] = (), transient_codes: Iterable[int] = (),
+                 rejected_status: Iterable[int] = (429,)):
+        """
+        :param rate: requests per second allowed to each host, None for no pacing
+        :param burst: requests allowed at once before pacing sets in
+        :param retries: maximum retries of a transient failure
+        :param backoff: base delay in seconds of the first retry
+        :param max_backoff: maximum delay in seconds of any retry
+        :param timeout: seconds to wait on the server, None to wait indefinitely
+        :param concurrency: limit of simultaneous requests, shared by all apis using the policy
+        :param rejected_status: statuses of responses to requests the server did not handle
+        """
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        if concurrency is None:
+            self.concurrency = AdaptiveLimit()
+        else:
+            self.concurrency = concurrency
+
+        self.throttle_status = frozenset(throttle_status)
+        self.transient_status = frozenset(transient_status)
+        self.throttle_codes = frozenset(throttle_codes)
+        self.transient_codes = frozenset(transient_codes)
+        self.rejected_status = frozenset(rejected_status)
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def pace(self, url: str):
+        """
+        block until a request to the host of [url] is allowed
+        """
+        if self.rate is None:
+            return
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+
+            bucket = self._buckets[host]
+
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def delay(self, attempt: int) -> float:
+        """
+        :param attempt: number of retries made so far
+        :return: seconds to wait before the next retry
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def classify(self, error: Exception, idempotent: bool = True) -> Optional[str]:
+        """
+        :param idempotent: whether the request can be repeated without effect, see TransportPolicy
+        :return: 'throttle', 'transient' or None when the failure is permanent
+        """
+        if isinstance(error, ApiError):
+            if not idempotent and error.status not in self.rejected_status:
+                return None
+
+            if error.status in self.throttle_status or error.code in self.throttle_codes:
+                return 'throttle'
+            if error.status in self.transient_status or error.code in self.transient_codes:
+                return 'transient'
+            if error.status in self.rejected_status:
+                return 'throttle'
+
+        elif isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            if idempotent or self.not_sent(error):
+                return 'transient'
+
+        return None
+
+    @staticmethod
+    def not_sent(error: Exception) -> bool:
+        """
+        :return: whether [error] was raised before the request was sent
+        """
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+
+        # requests wraps failures to connect as a MaxRetryError of a NewConnectionError
+        reason = error.args[0] if error.args else None
+        return isinstance(reason, MaxRetryError) and isinstance(reason.reason, NewConnectionError)
+
+    def send(self, session: requests.Session, method: str, url: str, handle: Callable[[requests.Response], Any],
+             idempotent: bool = None, **kwargs) -> Any:
+        """
+        issue a request with [session] under this policy
+
+        :param handle: validates the response and returns what is made of it, raising on failure
+        :param idempotent: whether the request can be repeated without effect, by default true of GET requests
+        :param kwargs: passed to Session.request
+        :raises ApiError: if the request failed permanently or ran out of retries
+        :return: result of [handle]
+        """
+        if idempotent is None:
+            idempotent = method.upper() in ('GET', 'HEAD', 'OPTIONS')
+
+        attempt = 0
+        while True:
+            try:
+                with self.concurrency.slot():
+                    self.pace(url)
+
+                    response = session.request(method, url, timeout=self.timeout, **kwargs)
+                    result = handle(response)
+
+            except Exception as e:
+                kind = self.classify(e, idempotent)
+                if kind == 'throttle':
+                    self.concurrency.throttled()
+
+                if kind is None or attempt >= self.retries:
+                    raise
+
+                time.sleep(self.delay(attempt))
+                attempt += 1
+
+            else:
+                self.concurrency.succeeded()
+                return result
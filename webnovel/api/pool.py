@@ -0,0 +1,70 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    connections shared by the sessions it creates
+
+    each session keeps its own cookies, while tcp/tls connections are reused between them.
+    apis are given sessions from the process wide pool unless told otherwise
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 32, pool_block: bool = False,
+                 keep_alive: bool = True):
+        """
+        :param pool_connections: number of hosts whose connections are kept
+        :param pool_maxsize: number of connections kept for each host
+        :param pool_block: whether to wait for a free connection instead of opening one past [pool_maxsize]
+        :param keep_alive: whether connections are reused at all
+        """
+        self.keep_alive = keep_alive
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def session(self) -> requests.Session:
+        """
+        :return: new session using the connections of the pool
+        """
+        session = requests.Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def close(self):
+        """
+        close all connections, sessions of the pool can no longer be used
+        """
+        self.adapter.close()
+
+
+_default_pool = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> SessionPool:
+    """
+    :return: process wide pool, created on first use
+    """
+    global _default_pool
+
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+
+        return _default_pool
+
+
+def set_default_pool(pool: SessionPool):
+    """
+    replace the process wide pool, used by apis created afterwards
+    """
+    global _default_pool
+
+    with _default_lock:
+        _default_pool = pool
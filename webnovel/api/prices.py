@@ -0,0 +1,124 @@
+import sqlite3
+import threading
+import time
+from typing import Optional, Iterable, Tuple, Dict
+
+
+class PriceStore:
+    """
+    sqlite backed record of chapter prices, keyed by novel id and chapter id
+
+    prices rarely change, so a price observed within [max_age] seconds is trusted
+    rather than requesting the chapter again. unlike ChapterCache it holds no content
+    and does not depend on the account, so it can be shared between accounts
+
+    example usage:
+
+        api = ParsedApi(cookies, prices=PriceStore('prices.sqlite'))
+
+    """
+
+    def __init__(self, path: str = ':memory:', max_age: Optional[float] = 7 * 24 * 60 * 60):
+        """
+        :param path: sqlite database file, kept in memory by default
+        :param max_age: seconds a price is trusted after it was observed, None to trust indefinitely
+        """
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+
+        # analysers probe chapters from several threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS prices (
+                novel_id TEXT NOT NULL,
+                chapter_id TEXT NOT NULL,
+                cost INTEGER NOT NULL,
+                observed_at REAL NOT NULL,
+                PRIMARY KEY (novel_id, chapter_id)
+            );
+        ''')
+
+    def get(self, novel_id, chapter_id) -> Optional[int]:
+        """
+        :return: price of the chapter, None if never observed or older than [max_age]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT cost, observed_at FROM prices WHERE novel_id = ? AND chapter_id = ?',
+                (str(novel_id), str(chapter_id))
+            ).fetchone()
+
+            if row is None or (self.max_age is not None and time.time() - row[1] > self.max_age):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return row[0]
+
+    def get_novel(self, novel_id) -> Dict[int, int]:
+        """
+        :return: prices of the chapters of the novel observed within [max_age], keyed by chapter id
+        """
+        query = 'SELECT chapter_id, cost FROM prices WHERE novel_id = ?'
+        params = (str(novel_id),)
+        if self.max_age is not None:
+            query += ' AND observed_at >= ?'
+            params += (time.time() - self.max_age,)
+
+        with self._lock:
+            return {int(chapter_id): cost for chapter_id, cost in self._connection.execute(query, params)}
+
+    def put(self, novel_id, chapter_id, cost: int, observed_at: float = None):
+        """
+        record [cost] of the chapter, replacing any previous observation
+
+        :param observed_at: unix time the price was observed, now by default
+        """
+        self.put_many(novel_id, [(chapter_id, cost)], observed_at)
+
+    def put_many(self, novel_id, prices: Iterable[Tuple[int, int]], observed_at: float = None):
+        """
+        record the prices of several chapters of a novel at once
+
+        :param prices: pairs of chapter id and cost
+        :param observed_at: unix time the prices were observed, now by default
+        """
+        if observed_at is None:
+            observed_at = time.time()
+
+        novel_id = str(novel_id)
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?)',
+                ((novel_id, str(chapter_id), cost, observed_at) for chapter_id, cost in prices)
+            )
+
+    def remove(self, novel_id, chapter_id=None):
+        """
+        forget the price of a chapter, or of every chapter of the novel when [chapter_id] is None
+        """
+        with self._lock, self._connection:
+            if chapter_id is None:
+                self._connection.execute('DELETE FROM prices WHERE novel_id = ?', (str(novel_id),))
+            else:
+                self._connection.execute(
+                    'DELETE FROM prices WHERE novel_id = ? AND chapter_id = ?', (str(novel_id), str(chapter_id))
+                )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM prices')
+
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM prices').fetchone()[0]
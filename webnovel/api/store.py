@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .base import BaseApi
+from .parsed import ParsedApi
+from ..models import Chapter
+
+
+@dataclass
+class TocDelta:
+    novel_id: int
+    new: List[Chapter] = field(default_factory=list)
+    unlocked: List[Chapter] = field(default_factory=list)
+    price_changed: List[Chapter] = field(default_factory=list)
+    removed: List[Chapter] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.new or self.unlocked or self.price_changed or self.removed)
+
+
+class TocStore:
+    """
+    keeps the last table of contents of each novel and reports what changed on refresh
+
+    chapters already known are updated in place rather than created anew,
+    so a refresh allocates only for chapters that were not seen before
+
+    example usage:
+
+        store = TocStore(api)
+        for novel_id in library:
+            delta = store.refresh(novel_id)
+            if delta.new:
+                ...
+
+    """
+
+    def __init__(self, api: BaseApi = None):
+        """
+        :param api: api used to request chapter lists
+        """
+        if api is None:
+            self.api = BaseApi()
+        else:
+            self.api = api
+
+        # novel id -> chapter id -> chapter
+        self._chapters: Dict[int, Dict[int, Chapter]] = {}
+
+        # novel id -> volume name -> chapters
+        self._volumes: Dict[int, Dict[str, List[Chapter]]] = {}
+
+    def refresh(self, novel_id) -> TocDelta:
+        """
+        request the chapter list of the novel and merge it into the stored snapshot
+
+        the first refresh of a novel reports all of its chapters as new
+
+        :param novel_id: novel to refresh
+        :return: changes since the previous refresh
+        """
+        # the raw response is needed, even when api is a ParsedApi
+        response = BaseApi.toc(self.api, novel_id)
+
+        known = self._chapters.get(novel_id, {})
+        chapters = {}
+        volumes = {}
+        delta = TocDelta(novel_id=novel_id)
+
+        for volume_item in response['data']['volumeItems']:
+            volume = []
+            for item in volume_item['chapterItems']:
+                chapter = known.get(item['id'])
+                is_new = chapter is None
+
+                if is_new:
+                    chapter = ParsedApi.parse_toc_item(novel_id, item)
+                    delta.new.append(chapter)
+                else:
+                    locked = not int(item['isAuth'])
+                    if chapter.locked and not locked:
+                        delta.unlocked.append(chapter)
+
+                    chapter.locked = locked
+                    chapter.no = item['index']
+                    chapter.title = item['name']
+
+                # price is only compared when the chapter list carries it
+                price = item.get('price')
+                if price is not None and price != chapter.cost:
+                    if not is_new:
+                        delta.price_changed.append(chapter)
+
+                    chapter.cost = price
+
+                chapters[item['id']] = chapter
+                volume.append(chapter)
+
+            volumes[ParsedApi.parse_volume_name(volume_item)] = volume
+
+        delta.removed = [chapter for chapter_id, chapter in known.items() if chapter_id not in chapters]
+
+        self._chapters[novel_id] = chapters
+        self._volumes[novel_id] = volumes
+
+        return delta
+
+    def toc(self, novel_id) -> Dict[str, List[Chapter]]:
+        """
+        :return: stored table of contents, same form as ParsedApi.toc
+        :raises KeyError: if the novel was never refreshed
+        """
+        return self._volumes[novel_id]
+
+    def forget(self, novel_id):
+        """
+        drop the stored snapshot of the novel
+        """
+        self._chapters.pop(novel_id, None)
+        self._volumes.pop(novel_id, None)
+
+    def __contains__(self, novel_id):
+        return novel_id in self._volumes
@@ -2,21 +2,23 @@ import json
 import re
 from typing import List, Union, Dict
 
-from bs4 import BeautifulSoup
+from lxml.etree import LxmlError
+from requests import RequestException
 from requests.cookies import RequestsCookieJar
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementClickInterceptedException, \
+    WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from .analytic import IAnalyser, Analysis
 from .api import ParsedApi, UnlockType
 from .decorators import require_signin, redirect
-from .exceptions import NotSignedInException, NotANovelUrlException, GuardException, CaptchaException
+from .driver import create_driver, EventWait, present, url_startswith
+from .exceptions import NotSignedInException, NotANovelUrlException, GuardException, CaptchaException, ApiError
+from .extract import extract, PROFILE, LIBRARY, NOVEL, CHAPTER
 from .models import Profile, Novel, Chapter
+from .parsers import get_parser
+from .session import cookie_dicts, cdp_cookies
 from .tools import UrlTools
 
 BASE_URL = 'https://www.webnovel.com'
@@ -26,22 +28,32 @@ EMAIL_LOGIN_URL = 'https://passport.webnovel.com/emaillogin.html?appid=900&areai
                   '=&logintab=&popup=1&format=redirect '
 GUARD_URL = 'https://passport.webnovel.com/guard.html'
 
+# failures of a read through the api, after which the driver is used instead.
+# pages that do not parse raise lxml errors, or ValueError and IndexError on unexpected content
+API_FAILURES = (ApiError, RequestException, IndexError, ValueError, LxmlError)
+
 
 class WebnovelBot:
     min_timeout = 10
     user_timeout = 600
 
-    def __init__(self, driver: WebDriver = None, timeout=10):
+    def __init__(self, driver: WebDriver = None, timeout=10, api_first=False):
         """
-        :param driver: selenium web driver to use
+        :param driver: selenium web driver to use, one from driver.create_driver when None,
+                       which loads images so captchas can be solved by hand
         :param timeout: timeout for all class operations
+        :param api_first: read profile, novels, chapters and table of contents through the api
+                          with the cookies of the driver, using the driver only when the api fails
         """
         if driver is None:
-            self.driver = webdriver.Chrome()
+            self.driver = create_driver(block_images=False)
         else:
             self.driver = driver
 
         self.timeout = timeout
+        self.api_first = api_first
+
+        self._api = None
 
     def create_api(self) -> ParsedApi:
         """
@@ -49,6 +61,16 @@ class WebnovelBot:
         """
         return ParsedApi(self.driver.get_cookies())
 
+    @property
+    def api(self) -> ParsedApi:
+        """
+        api with cookies of the driver, created on first use and again after cookies change
+        """
+        if self._api is None:
+            self._api = self.create_api()
+
+        return self._api
+
     @property
     def novel_id(self):
         """
@@ -82,10 +104,16 @@ class WebnovelBot:
     @require_signin
     def profile(self):
         """
-        get profile information from popup
+        get profile information, from the profile page through the api when [api_first]
+        else from popup
 
         :return: WebnovelProfile object
         """
+        if self.api_first:
+            try:
+                return Profile.from_html(self.api.html.profile(), self.user_id)
+            except API_FAILURES:
+                pass
 
         self._focus_profile()
 
@@ -101,10 +129,7 @@ class WebnovelBot:
             raise ValueError('fields do not match')
 
         # generate dictionary using field_mapper as title value
-        profile_data = {
-            field: int(self.driver.find_element_by_css_selector(f"a[title='{value}'] > em").text)
-            for field, value in field_mapper.items()
-        }
+        profile_data = {field: int(value) for field, value in extract(self.driver, PROFILE, field_mapper).items()}
 
         return Profile(id=self.user_id, **profile_data)
 
@@ -118,6 +143,9 @@ class WebnovelBot:
         :raises CaptchaException: if manual is false and captcha is required during signin
         :raises GuardException: if manual is false and signin process redirected to guard
         """
+        # cookies change, so the api is created again when next used
+        self._api = None
+
         # go to login path
         self.driver.get(EMAIL_LOGIN_URL)
 
@@ -127,14 +155,11 @@ class WebnovelBot:
         signin_btn = self.driver.find_element_by_id('submit')
         signin_btn.click()
 
-        wait = WebDriverWait(self.driver, self.timeout)
-        wait_user = WebDriverWait(self.driver, self.user_timeout)
+        wait = EventWait(self.driver, self.timeout)
+        wait_user = EventWait(self.driver, self.user_timeout)
 
-        # wait until redirected
-        wait.until(lambda driver: (
-                not self.driver.current_url.startswith(EMAIL_RAW_URL)
-                or driver.find_elements_by_css_selector('#google-code-html iframe')  # checks if captcha appeared
-        ))
+        # wait until redirected, or until captcha appeared
+        wait.until(~url_startswith(EMAIL_RAW_URL) | present('#google-code-html iframe'))
 
         # this handles the cases where the captcha has appeared
         captchas = self.driver.find_elements_by_css_selector('#google-code-html iframe')
@@ -143,32 +168,41 @@ class WebnovelBot:
                 raise CaptchaException
 
             # wait until user has solved the captcha
-            wait_user.until(lambda driver: not self.driver.current_url.startswith(EMAIL_RAW_URL))
+            wait_user.until_not(url_startswith(EMAIL_RAW_URL))
 
         # check if the redirected url is the guard, guard is shown when password is incorrect
         if self.driver.current_url.startswith(GUARD_URL):
             if not manual:
                 raise GuardException
 
-            wait_user.until(lambda driver: not self.driver.current_url.startswith(GUARD_URL))
+            wait_user.until_not(url_startswith(GUARD_URL))
 
         # wait till signin success ends
-        WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a[title='My Profile']"))
-        )
+        wait.until(present("a[title='My Profile']"))
 
         # wait for the preferences popup to load and click it away
         try:
-            wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".j_post_preference"))
-            )
+            wait.until(present('.j_post_preference'))
 
             pref_button = self.driver.find_element_by_class_name('j_post_preference')  # bt _m mw160 j_post_preference
             pref_button.click()
         except TimeoutException:
             pass
 
-    def add_cookiejar(self, cookies: RequestsCookieJar):
+    def add_cookiejar(self, cookies: Union[RequestsCookieJar, List[dict]]):
+        """
+        :param cookies: cookie jar, or cookies as returned by WebDriver.get_cookies
+        """
+        cookies = cookie_dicts(cookies)
+        self._api = None
+
+        # all at once when the driver supports it, without having to load webnovel first
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            try:
+                self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies(cookies)})
+                return
+            except WebDriverException:
+                pass
 
         # selenium prevents adding cookies of domains that arent from the currently active url
         # this code makes sure we are in webnovel
@@ -177,10 +211,10 @@ class WebnovelBot:
 
         for cookie in cookies:
             self.driver.add_cookie({
-                'name': cookie.name,
-                'value': cookie.value,
-                'domain': cookie.domain,
-                'path': cookie.path,
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie['domain'],
+                'path': cookie['path'],
             })
 
     @require_signin
@@ -192,10 +226,10 @@ class WebnovelBot:
         signout_button = self.driver.find_element_by_css_selector("a[class*='j_logout']")
         signout_button.click()
 
+        self._api = None
+
         # wait till logged out
-        WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.login-btn'))
-        )
+        EventWait(self.driver, self.timeout).until(present('.login-btn'))
 
     def is_signedin(self) -> bool:
         """
@@ -218,59 +252,61 @@ class WebnovelBot:
         if redirect:
             self.driver.get(f'{BASE_URL}/library')
 
-        # all novel containers
-        novel_elements = self.driver.find_elements_by_css_selector('.lib-books > li')
-
         novels = []
-        for element in novel_elements:
-            link = element.find_element_by_css_selector('a')
-
+        for item in extract(self.driver, LIBRARY):
             novel = Novel(
-                title=link.text,
-                url=link.get_attribute('href')
+                title=item['title'],
+                url=item['url']
             )
 
             # this attribute does not exist in Novel class
             # ... it might be useful
-            novel.update = '_update' in element.get_attribute('class')
+            novel.update = item['update']
 
             novels.append(novel)
 
         return novels
 
-    @redirect
     def novel(self, url=None) -> Novel:
         """
-        :param url: url to novel
+        :param url: url to novel, the current url when None
         :return: Novel object
         """
-        info_elems = self.driver.find_elements_by_css_selector('._mn > *')
-        subinfo_elems = info_elems[1].find_elements_by_css_selector(':scope > *')
-        writerinfo_elems = info_elems[2].find_elements_by_css_selector('p > *')
+        if self.api_first:
+            try:
+                novel_id = UrlTools.from_novel_url(self.driver.current_url if url is None else url)
+                return get_parser().novel(self.api.html.novel(novel_id), UrlTools.to_novel_url(novel_id))
+            except API_FAILURES:
+                pass
+
+        return self._novel(url=url)
+
+    @redirect
+    def _novel(self, url=None) -> Novel:
+        page = extract(self.driver, NOVEL)
+        writer_info = page['writer_info']
 
         novel = Novel()
 
-        novel.id = self.driver.current_url.split('/')[4]
-        novel.title = info_elems[0].text[:-len(info_elems[0].find_element_by_tag_name('small').text) - 1],
-        novel.title = novel.title[0]
+        novel.id = page['url'].split('/')[4]
+        novel.title = page['heading'][:-len(page['heading_small']) - 1]
 
-        novel.synopsis = self.driver.find_element_by_css_selector("div[class*='j_synopsis'] > p").text
-        novel.genre = subinfo_elems[0].text,
-        novel.views = subinfo_elems[-1].text[:-6],
-        novel.url = self.driver.current_url
+        novel.synopsis = page['synopsis']
+        novel.genre = page['subinfo'][0]
+        novel.views = page['subinfo'][-1][:-6]
+        novel.url = page['url']
         novel.cover_url = f'https://img.webnovel.com/bookcover/{novel.id}'
 
         # ratings are posted up to 5, they are converted to float and normalized to 1
-        novel.rating = float(info_elems[3].find_element_by_css_selector('strong').text) / 5.0,
+        novel.rating = float(page['rating']) / 5.0
 
         # stripped of all non numerals and converted to int
-        novel.review_count = int(
-            info_elems[3].find_element_by_css_selector('small').text.strip('()')[:-8].replace(',', ''))
+        novel.review_count = int(page['reviews'].strip('()')[:-8].replace(',', ''))
 
         # writer info
-        for i in range(round(len(writerinfo_elems) / 2)):
-            label = writerinfo_elems[i * 2].text.strip(':').lower()
-            value = writerinfo_elems[i * 2 + 1].text
+        for i in range(round(len(writer_info) / 2)):
+            label = writer_info[i * 2].strip(':').lower()
+            value = writer_info[i * 2 + 1]
 
             setattr(novel, label, value)
 
@@ -282,90 +318,69 @@ class WebnovelBot:
 
         :return: dict of volumes in order, where key is volume name and value the chapters
         """
+        if self.api_first:
+            try:
+                return self.api.toc(self.novel_id)
+            except API_FAILURES:
+                pass
+
+        return self._table_of_contents()
 
+    @redirect
+    def _table_of_contents(self, url=None) -> Dict[str, List[Chapter]]:
         # load table of contents
         table_of_contents = self.driver.find_element_by_css_selector('a.j_show_contents')
         table_of_contents.click()
 
         # wait until table of contents loads
-        WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((By.CLASS_NAME, 'volume-item'))
-        )
-
-        # using bs4 to parse
-        # bs4 is faster than selenium selectors
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        volume_elements = soup.find_all('div', {'class': 'volume-item'})
-        volumes = {}
-        for volume_element in volume_elements:
-            volume_chapters = volume_element.find_all('li', {'class': 'g_col_6'})
+        EventWait(self.driver, self.timeout).until(present('.volume-item'))
 
-            chapters = []
-            for chapter in volume_chapters:
-                no_element = chapter.select_one('a > i')
+        # parsed from page source, as it is faster than selenium selectors
+        return get_parser().table_of_contents(self.driver.page_source)
 
-                chapter = Chapter(
-                    title=chapter.select_one('a')['title'],
-                    url=f"http:{chapter.find('a')['href'].strip()}",
-                    locked=bool(chapter.select('a > svg'))
-                )
-
-                if no_element is not None:
-                    chapter.no = int(no_element.text.strip())
-                else:
-                    chapter.no = 0
-
-                chapter.id = chapter.chapter_id_from_url()
-
-                chapters.append(chapter)
-
-            _name = volume_element.find('h4').text
-            volume_name = re.sub(r'\n +', '', _name).replace(':', ': ')
-            volumes[volume_name] = chapters
-
-        return volumes
-
-    @redirect
     def chapter(self, url=None, is_locked=False) -> Chapter:
         """
-        :param url: url to chapter
+        :param url: url to chapter, the current url when None
         :param is_locked: whether the chapter is locked
         :return: Chapter object
         """
+        if self.api_first:
+            try:
+                novel_id, chapter_id = UrlTools.from_chapter_url(self.driver.current_url if url is None else url)
+                return self.api.chapter(novel_id, chapter_id)
+            except API_FAILURES:
+                pass
+
+        return self._chapter(url=url, is_locked=is_locked)
+
+    @redirect
+    def _chapter(self, url=None, is_locked=False) -> Chapter:
         # wait till chapter loads
-        wait = WebDriverWait(self.driver, self.timeout)
-        wait.until(
-            EC.presence_of_element_located((By.CLASS_NAME, 'cha-tit'))
-        )
+        wait = EventWait(self.driver, self.timeout)
+        wait.until(present('.cha-tit'))
 
         # if locked, ensure lock element loads
         # lock element may take some time to load
         if is_locked:
-            wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.j_locked_chap'))
-            )
+            wait.until(present('.j_locked_chap'))
+
+        page = extract(self.driver, CHAPTER)
 
         chapter = Chapter(
-            no=int(self.driver.find_element_by_css_selector('.j_chapIdx').text.strip('Chapter ')[:-1]),
-            url=self.driver.current_url,
-            title=self.driver.find_element_by_css_selector('.cha-tit').find_element_by_tag_name('h3').text,
-            locked=self.is_chapter_locked(),
+            no=int(page['index'].strip('Chapter ')[:-1]),
+            url=page['url'],
+            title=page['title'],
+            locked=page['locked'],
         )
 
         if chapter.locked:
-            if self.is_signedin():
-                unlock_params = self.driver.find_element_by_css_selector(
-                    "div[class*='lock-group j_lock_btns '] > a[class*='j_unlockChapter']"
-                ).get_attribute('data-unlock-params')
-            else:
-                unlock_params = self.driver.find_element_by_css_selector(
-                    "div[class*='lock-group j_lock_btns '] > a[class*='_bt_unlock']"
-                ).get_attribute('data-unlock-params')
+            unlock_params = page['unlock_params'] if self.is_signedin() else page['guest_unlock_params']
+            if unlock_params is None:
+                raise NoSuchElementException('unlock button of the chapter was not found')
 
             chapter.cost = json.loads(unlock_params)['chapterPrice']
         else:
-            chapter.paragraphs = [wrapper.text
-                                  for wrapper in self.driver.find_elements_by_css_selector('.cha-paragraph > span > p')]
+            chapter.paragraphs = page['paragraphs']
 
         return chapter
 
@@ -402,9 +417,7 @@ class WebnovelBot:
             raise NotSignedInException()
 
         # wait till lock element loads
-        WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.j_locked_chap'))
-        )
+        EventWait(self.driver, self.timeout).until(present('.j_locked_chap'))
 
         # check which options are available [coins, fastpass]
         # coins
@@ -457,13 +470,18 @@ class WebnovelBot:
                 self.unlock_chapter(c.url, fastpass=True)
 
         else:
-            api = self.create_api()
-            for c in analysis.via_coins:
-                api.unlock(c.novel_id_from_url(), c, UnlockType.coins)
-            for c in analysis.via_fastpass:
-                api.unlock(c.novel_id_from_url(), c, UnlockType.fastpass)
+            api = self.api if self.api_first else self.create_api()
+            for unlock_type, chapters in [(UnlockType.coins, analysis.via_coins),
+                                          (UnlockType.fastpass, analysis.via_fastpass)]:
+
+                # chapters of the same novel are unlocked together
+                novels = {}
+                for c in chapters:
+                    novels.setdefault(c.novel_id_from_url(), []).append(c)
+
+                for novel_id, novel_chapters in novels.items():
+                    api.unlock_many(novel_id, novel_chapters, unlock_type)
 
-    @redirect
     def batch_analyze(self, analyser: IAnalyser, url=None) -> Analysis:
         """
         batch unlocks chapters in ascending order
@@ -471,11 +489,20 @@ class WebnovelBot:
         :require: to be signed in
 
         :param analyser: analyser for chapters to unlock
-        :param url: url to novel
+        :param url: url to novel, the current url when None
         :return: list of unlocked chapters
         """
+        # the novel page is only loaded when the table of contents is read through the driver
+        if self.api_first:
+            try:
+                toc = self.api.toc(UrlTools.from_novel_url(self.driver.current_url if url is None else url))
+            except API_FAILURES:
+                toc = self._table_of_contents(url=url)
+        else:
+            toc = self._table_of_contents(url=url)
+
         # get all locked chapters
-        locked_chapters = [chapter for chapters in self.table_of_contents().values() for chapter in chapters]
+        locked_chapters = [chapter for chapters in toc.values() for chapter in chapters]
 
         return analyser.analyse(locked_chapters)
 
@@ -526,10 +553,8 @@ class WebnovelBot:
         self.driver.execute_script("document.querySelector('.j_show_task_mod').click()")
 
         # wait till tasks are loaded
-        wait = WebDriverWait(self.driver, timeout=self.timeout)
-        wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.task-list-item'))
-        )
+        wait = EventWait(self.driver, timeout=self.timeout)
+        wait.until(present('.task-list-item'))
 
         # claim all rewards
         for claim in self.driver.find_elements_by_css_selector('.j_claim_task'):
@@ -539,9 +564,7 @@ class WebnovelBot:
         self.driver.execute_script("document.querySelector('#taskMod ._close').click()")
 
         # wait till popup closes
-        wait.until_not(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div#taskMod._on"))
-        )
+        wait.until_not(present('div#taskMod._on'))
 
     @require_signin
     def power_vote(self, url: str = None, repeat: int = 1):
@@ -560,9 +583,7 @@ class WebnovelBot:
         elif re.fullmatch(r'https://.+?/book/.+?(/|$)', self.driver.current_url):
             raise ValueError('currently loaded url is not a valid novel url')
 
-        WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.j_vote_power'))
-        )
+        EventWait(self.driver, self.timeout).until(present('.j_vote_power'))
 
         # get power stone energy_vote button
         # exception is thrown when user has no power stones
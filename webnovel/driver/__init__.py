@@ -0,0 +1,3 @@
+from .factory import create_driver, BLOCKED_URLS
+from .pool import DriverPool, headless_chrome
+from .wait import EventWait, Condition, present, absent, url_startswith
@@ -0,0 +1,191 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .factory import create_driver
+
+# sites whose storage is cleared between leases
+ORIGINS = ('https://www.webnovel.com', 'https://passport.webnovel.com')
+
+
+def headless_chrome() -> WebDriver:
+    """
+    :return: headless chrome driver, configured by create_driver
+    """
+    return create_driver(headless=True)
+
+
+class DriverPool:
+    """
+    pool of drivers launched ahead of time and leased to one user at a time
+
+    drivers are reset between leases, and replaced after [max_uses] leases
+    so that a long running browser does not keep growing
+
+    example usage:
+
+        with DriverPool(size=4) as pool:
+            with pool.bot() as bot:
+                bot.add_cookiejar(cookiejar)
+                bot.claim_tasks()
+
+    """
+
+    def __init__(self, size: int = 4, max_uses: Optional[int] = 50, factory: Callable[[], WebDriver] = None,
+                 prelaunch: bool = True):
+        """
+        :param size: number of drivers in the pool
+        :param max_uses: leases after which a driver is replaced, None to never replace
+        :param factory: creates a driver, headless chrome by default
+        :param prelaunch: launch all the drivers now, else each is launched on its first lease
+        """
+        if size < 1:
+            raise ValueError('[size] must be at least 1')
+
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = headless_chrome if factory is None else factory
+
+        self._uses = {}
+        self._leased = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # None marks a driver yet to be launched
+        self._idle = queue.Queue()
+        if prelaunch:
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                futures = [executor.submit(self.factory) for _ in range(size)]
+
+            drivers = [future.result() for future in futures if future.exception() is None]
+            failed = [future.exception() for future in futures if future.exception() is not None]
+
+            # drivers that did launch would otherwise be left running
+            if failed:
+                for driver in drivers:
+                    self._discard(driver)
+                raise failed[0]
+
+            for driver in drivers:
+                self._idle.put(driver)
+        else:
+            for _ in range(size):
+                self._idle.put(None)
+
+    def lease(self, timeout: float = None) -> WebDriver:
+        """
+        :param timeout: seconds to wait for a driver to be released, None waits indefinitely
+        :raises queue.Empty: if no driver was released within [timeout]
+        :return: driver, to be given back with DriverPool.release
+        """
+        if self._closed:
+            raise RuntimeError('pool is closed')
+
+        driver = self._idle.get(timeout=timeout)
+        if driver is None:
+            try:
+                driver = self.factory()
+            except Exception:
+                self._idle.put(None)
+                raise
+
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            self._leased.add(driver)
+
+        return driver
+
+    def release(self, driver: WebDriver):
+        """
+        give back a leased driver, which is reset for the next lease or replaced
+
+        :raises ValueError: if [driver] is not leased from this pool
+        """
+        with self._lock:
+            if driver not in self._leased:
+                raise ValueError('driver is not leased from this pool')
+
+            self._leased.remove(driver)
+            worn = self.max_uses is not None and self._uses[driver] >= self.max_uses
+
+        if self._closed or worn or not self._reset(driver):
+            self._discard(driver)
+            self._idle.put(None)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def bot(self, timeout=10, lease_timeout: float = None, **kwargs):
+        """
+        lease a driver as a WebnovelBot, released when the block exits
+
+        :param timeout: see WebnovelBot
+        :param lease_timeout: see DriverPool.lease
+        :param kwargs: passed to WebnovelBot
+        """
+        # imported here as the bot is not needed to pool drivers
+        from ..bot import WebnovelBot
+
+        driver = self.lease(lease_timeout)
+        try:
+            yield WebnovelBot(driver, timeout=timeout, **kwargs)
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """
+        quit all idle drivers, leased drivers are quit when released
+        """
+        self._closed = True
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            if driver is not None:
+                self._discard(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> bool:
+        """
+        clear cookies, storage and page left by the previous lease
+
+        :return: whether the driver is still usable
+        """
+        try:
+            # delete_all_cookies and the storage of the page only reach the current site
+            if hasattr(driver, 'execute_cdp_cmd'):
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                for origin in ORIGINS:
+                    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            else:
+                driver.delete_all_cookies()
+                driver.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}')
+
+            driver.get('about:blank')
+        except WebDriverException:
+            return False
+
+        return True
+
+    def _discard(self, driver: WebDriver):
+        with self._lock:
+            self._uses.pop(driver, None)
+
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
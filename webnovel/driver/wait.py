@@ -0,0 +1,154 @@
+import json
+import time
+from typing import Callable, Union
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const check = () => {
+    try {
+        return Boolean(%s);
+    } catch (e) {
+        return false;
+    }
+};
+
+if (check()) {
+    done(true);
+    return;
+}
+
+let finished = false;
+const finish = result => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+};
+
+const observer = new MutationObserver(() => check() && finish(true));
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+
+// url changes through the history api do not mutate the document
+const interval = setInterval(() => check() && finish(true), 100);
+const timer = setTimeout(() => finish(false), arguments[0]);
+'''
+
+
+class Condition:
+    """
+    javascript expression on the loaded page, combined with | & and negated with ~
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return Condition(f'({self.expression}) || ({other.expression})')
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return Condition(f'({self.expression}) && ({other.expression})')
+
+    def __invert__(self) -> 'Condition':
+        return Condition(f'!({self.expression})')
+
+    def script(self) -> str:
+        return _SCRIPT % self.expression
+
+
+def present(selector: str) -> Condition:
+    """
+    :return: condition met when an element matches css [selector]
+    """
+    return Condition(f'document.querySelector({json.dumps(selector)}) !== null')
+
+
+def absent(selector: str) -> Condition:
+    """
+    :return: condition met when no element matches css [selector]
+    """
+    return ~present(selector)
+
+
+def url_startswith(prefix: str) -> Condition:
+    """
+    :return: condition met when the url of the page starts with [prefix]
+    """
+    return Condition(f'location.href.startsWith({json.dumps(prefix)})')
+
+
+class EventWait:
+    """
+    waits on a condition from within the page, resolving as soon as the page changes to meet it
+    rather than polling the driver
+
+    a navigation away from the page interrupts the wait, which then continues on the new page.
+    callables, such as expected_conditions, are waited on with a WebDriverWait
+
+    example usage:
+
+        EventWait(driver, 10).until(present('.cha-tit'))
+
+    """
+
+    # longest a single script waits, below the default script timeout of the driver
+    slice = 10
+
+    def __init__(self, driver: WebDriver, timeout: float):
+        """
+        :param driver: driver whose page is waited on
+        :param timeout: seconds to wait before raising TimeoutException
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    # messages of the errors raised when the page navigates while a script waits
+    navigated = ('document unloaded', 'target navigated')
+
+    def until(self, condition: Union[Condition, Callable], message: str = ''):
+        """
+        :raises TimeoutException: if [condition] is not met within [timeout]
+        :return: True, or the value returned by a callable [condition]
+        """
+        if not isinstance(condition, Condition):
+            return WebDriverWait(self.driver, self.timeout).until(condition, message)
+
+        script = condition.script()
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message)
+
+            try:
+                if self.driver.execute_async_script(script, int(min(remaining, self.slice) * 1000)):
+                    return True
+            except TimeoutException:
+                # the driver timed the script out before it finished
+                pass
+            except WebDriverException as e:
+                # a page unloading is a javascript error, or an unknown error with some drivers.
+                # anything else, such as a closed window or a dead session, will not pass by waiting
+                if not any(navigated in str(e.msg).lower() for navigated in self.navigated):
+                    raise
+
+                time.sleep(0.05)
+
+    def until_not(self, condition: Union[Condition, Callable], message: str = ''):
+        """
+        :raises TimeoutException: if [condition] still holds after [timeout]
+        :return: True, or the value returned by a callable [condition]
+        """
+        if not isinstance(condition, Condition):
+            return WebDriverWait(self.driver, self.timeout).until_not(condition, message)
+
+        return self.until(~condition, message)
@@ -13,7 +13,32 @@ class NotANovelUrlException(Exception):
 
 
 class ApiError(Exception):
-    pass
+    """
+    Raised when the api rejects a request
+
+    [code] is the code of the api response and [status] the http status, when known
+    """
+
+    def __init__(self, msg=None, code=None, status=None):
+        super().__init__(msg)
+
+        self.code = code
+        self.status = status
+
+
+class UnlockError(ApiError):
+    """
+    Raised when unlocking chapters in batches fails part way
+
+    [unlocked] are the chapters unlocked before the failure, [pending] those that were not.
+    the first batch of [pending] may have been unlocked if its response was lost
+    """
+
+    def __init__(self, msg=None, code=None, status=None, unlocked=None, pending=None):
+        super().__init__(msg, code, status)
+
+        self.unlocked = [] if unlocked is None else unlocked
+        self.pending = [] if pending is None else pending
 
 
 class GuardException(Exception):
@@ -0,0 +1,77 @@
+"""
+scripts extracting everything a scraping method needs from the loaded page in a single
+WebDriver command, rather than a command for every element, text and attribute
+
+each script returns a json payload of the texts (as WebElement.text would give) and attributes read,
+and raises a javascript error, as find_element would, when a required element is missing
+"""
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_PRELUDE = '''
+const text = element => element.innerText.trim();
+const one = (root, selector) => {
+    const element = root.querySelector(selector);
+    if (element === null) {
+        throw new Error('no such element: ' + selector);
+    }
+    return element;
+};
+'''
+
+# arguments[0] maps profile fields to the title of their element
+PROFILE = _PRELUDE + '''
+const fields = {};
+for (const [field, title] of Object.entries(arguments[0])) {
+    fields[field] = text(one(document, `a[title='${title}'] > em`));
+}
+return fields;
+'''
+
+LIBRARY = _PRELUDE + '''
+return Array.from(document.querySelectorAll('.lib-books > li'), element => {
+    const link = one(element, 'a');
+    return {title: text(link), url: link.href, update: element.classList.contains('_update')};
+});
+'''
+
+NOVEL = _PRELUDE + '''
+const info = document.querySelectorAll('._mn > *');
+return {
+    url: location.href,
+    heading: text(info[0]),
+    heading_small: text(one(info[0], 'small')),
+    synopsis: text(one(document, "div[class*='j_synopsis'] > p")),
+    subinfo: Array.from(info[1].children, text),
+    rating: text(one(info[3], 'strong')),
+    reviews: text(one(info[3], 'small')),
+    writer_info: Array.from(info[2].querySelectorAll('p > *'), text),
+};
+'''
+
+CHAPTER = _PRELUDE + '''
+const unlock = selector => {
+    const button = document.querySelector(`div[class*='lock-group j_lock_btns '] > a[class*='${selector}']`);
+    return button === null ? null : button.getAttribute('data-unlock-params');
+};
+return {
+    url: location.href,
+    index: text(one(document, '.j_chapIdx')),
+    title: text(one(one(document, '.cha-tit'), 'h3')),
+    locked: document.querySelector('.j_locked_chap') !== null,
+    unlock_params: unlock('j_unlockChapter'),
+    guest_unlock_params: unlock('_bt_unlock'),
+    paragraphs: Array.from(document.querySelectorAll('.cha-paragraph > span > p'), text),
+};
+'''
+
+
+def extract(driver: WebDriver, script: str, *args) -> Any:
+    """
+    :param driver: driver with the page loaded
+    :param script: one of the scripts of this module
+    :param args: arguments of the script
+    :return: payload of the script
+    """
+    return driver.execute_script(script, *args)
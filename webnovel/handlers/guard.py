@@ -3,6 +3,7 @@ from selenium.common.exceptions import NoSuchElementException
 from .handler import IHandler
 from ..bot import GUARD_URL
 from ..decorators import chainable
+from ..driver import present, url_startswith
 
 
 class GuardHandler(IHandler):
@@ -48,10 +49,7 @@ class GuardHandler(IHandler):
         self.back_button.click()
 
     def wait_until_confirmed(self):
-        self.wait.until(lambda driver: (
-                not self.driver.current_url.startswith(GUARD_URL)
-                or self.driver.find_elements_by_css_selector('.error_tip._on')
-        ))
+        self.wait.until(~url_startswith(GUARD_URL) | present('.error_tip._on'))
 
         try:
             self.get('.error_tip._on')
@@ -1,9 +1,7 @@
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from ..bot import WebnovelBot
+from ..driver import EventWait, present
 
 
 class IHandler:
@@ -14,19 +12,15 @@ class IHandler:
         self.bot = bot
         self.driver = bot.driver
 
-        self.wait = WebDriverWait(self.driver, self.bot.timeout)
+        self.wait = EventWait(self.driver, self.bot.timeout)
 
     def get(self, selector):
         return self.driver.find_element_by_css_selector(selector)
 
     def wait_for(self, selector):
-        self.wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-        )
+        self.wait.until(present(selector))
 
     def wait_and_get(self, selector):
-        self.wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-        )
+        self.wait.until(present(selector))
 
         return self.driver.find_element_by_css_selector(selector)
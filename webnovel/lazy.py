@@ -0,0 +1,50 @@
+import functools
+import importlib
+from typing import Dict
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str]):
+    """
+    module __getattr__ and __dir__ importing the attributes of a package on first use,
+    so importing a package does not import the dependencies of all its modules
+
+    example usage, in __init__.py:
+
+        __getattr__, __dir__, __all__ = lazy_attributes(__name__, {'ParsedApi': '.parsed'})
+
+    :param package: name of the package
+    :param attributes: name of each attribute and the module it is imported from, relative to [package]
+    :return: __getattr__, __dir__ and __all__ of the package
+    """
+
+    def __getattr__(name):
+        try:
+            module = attributes[name]
+        except KeyError:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}') from None
+
+        value = getattr(importlib.import_module(module, package), name)
+
+        # later lookups find it without calling __getattr__
+        setattr(importlib.import_module(package), name, value)
+
+        return value
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package))) | set(attributes))
+
+    return __getattr__, __dir__, list(attributes)
+
+
+@functools.lru_cache(maxsize=None)
+def optional_module(name: str):
+    """
+    import an optional dependency when first needed rather than with the module using it
+
+    :param name: name of the module
+    :return: the module, None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -1,3 +1,11 @@
-from .chapter import Chapter
-from .novel import Novel
-from .profile import Profile
+from ..lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    'Chapter': '.chapter',
+    'ColumnarToc': '.columnar',
+    'CompactChapter': '.compact',
+    'CompactNovel': '.compact',
+    'CompactProfile': '.compact',
+    'Novel': '.novel',
+    'Profile': '.profile',
+})
@@ -2,9 +2,6 @@ import json
 from dataclasses import dataclass
 from typing import List
 
-import requests
-from bs4 import BeautifulSoup
-
 from ..decorators import deprecated
 
 
@@ -21,6 +18,9 @@ class Chapter:
 
     @deprecated('use Webnovel.api.ParsedApi.chapter instead')
     def load(self):
+        import requests
+        from bs4 import BeautifulSoup
+
         data = requests.get(self.url)
 
         soup = BeautifulSoup(data.content, 'html.parser')
@@ -0,0 +1,144 @@
+import json
+import struct
+import sys
+from array import array
+from typing import List, Iterable, Tuple
+
+from .chapter import Chapter
+from ..lazy import optional_module
+from ..tools import UrlTools
+
+
+class ColumnarToc:
+    """
+    table of contents kept as parallel arrays, one entry per chapter in order
+
+     - [ids] chapter ids
+     - [indices] chapter numbers
+     - [locked] 1 when locked, else 0
+     - [costs] chapter cost, -1 when unknown
+
+    volume i holds the chapters from [volume_offsets][i] up to the offset of the next volume.
+    Chapter objects are only created when asked for
+    """
+
+    magic = b'WNTOC1'
+
+    # novel id, chapters, volumes
+    _header = struct.Struct('<qII')
+
+    def __init__(self, novel_id: int, ids: Iterable[int] = (), indices: Iterable[int] = (),
+                 locked: Iterable[int] = (), costs: Iterable[int] = None, volume_names: List[str] = None,
+                 volume_offsets: Iterable[int] = ()):
+        self.novel_id = int(novel_id)
+
+        self.ids = array('q', ids)
+        self.indices = array('i', indices)
+        self.locked = array('b', locked)
+        self.costs = array('i', [-1] * len(self.ids) if costs is None else costs)
+
+        self.volume_names = [] if volume_names is None else list(volume_names)
+        self.volume_offsets = array('i', volume_offsets)
+
+        if not len(self.ids) == len(self.indices) == len(self.locked) == len(self.costs):
+            raise ValueError('columns must be of the same length')
+        if len(self.volume_names) != len(self.volume_offsets):
+            raise ValueError('[volume_names] and [volume_offsets] must be of the same length')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def chapter(self, position: int) -> Chapter:
+        """
+        :param position: position of the chapter in the table of contents
+        :return: Chapter object of the chapter at [position]
+        """
+        cost = self.costs[position]
+
+        return Chapter(
+            no=self.indices[position],
+            id=self.ids[position],
+            url=UrlTools.to_chapter_url(self.novel_id, self.ids[position]),
+            locked=bool(self.locked[position]),
+            cost=None if cost < 0 else cost,
+        )
+
+    def locked_positions(self) -> List[int]:
+        return [i for i, locked in enumerate(self.locked) if locked]
+
+    def volume(self, index: int) -> Tuple[str, range]:
+        """
+        :return: name of the volume and the positions of its chapters
+        """
+        end = self.volume_offsets[index + 1] if index + 1 < len(self.volume_offsets) else len(self)
+
+        return self.volume_names[index], range(self.volume_offsets[index], end)
+
+    def as_numpy(self):
+        """
+        views of the columns as numpy arrays, without copying
+
+        :return: ids, indices, locked, costs
+        """
+        np = optional_module('numpy')
+        if np is None:
+            raise ImportError('numpy is required for ColumnarToc.as_numpy')
+
+        return (
+            np.frombuffer(self.ids, dtype=np.int64),
+            np.frombuffer(self.indices, dtype=np.int32),
+            np.frombuffer(self.locked, dtype=np.int8),
+            np.frombuffer(self.costs, dtype=np.int32),
+        )
+
+    def save(self, path: str):
+        """
+        write to [path] in a compact binary form, read back with ColumnarToc.load
+        """
+        names = json.dumps(self.volume_names).encode('utf-8')
+
+        with open(path, 'wb') as f:
+            f.write(self.magic)
+            f.write(self._header.pack(self.novel_id, len(self), len(self.volume_offsets)))
+            for column in (self.ids, self.indices, self.locked, self.costs, self.volume_offsets):
+                f.write(self._little_endian(column).tobytes())
+            f.write(names)
+
+    @staticmethod
+    def load(path: str) -> 'ColumnarToc':
+        """
+        :raises ValueError: if the file is not a saved ColumnarToc
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if not data.startswith(ColumnarToc.magic):
+            raise ValueError(f'{path} is not a saved table of contents')
+
+        offset = len(ColumnarToc.magic)
+        novel_id, count, volumes = ColumnarToc._header.unpack_from(data, offset)
+        offset += ColumnarToc._header.size
+
+        toc = ColumnarToc(novel_id)
+        for name, length in [('ids', count), ('indices', count), ('locked', count), ('costs', count),
+                             ('volume_offsets', volumes)]:
+            column = getattr(toc, name)
+
+            size = column.itemsize * length
+            column.frombytes(data[offset:offset + size])
+            offset += size
+
+            setattr(toc, name, ColumnarToc._little_endian(column))
+
+        toc.volume_names = json.loads(data[offset:].decode('utf-8'))
+
+        return toc
+
+    @staticmethod
+    def _little_endian(column: array) -> array:
+        if sys.byteorder == 'little':
+            return column
+
+        swapped = array(column.typecode, column)
+        swapped.byteswap()
+        return swapped
@@ -0,0 +1,182 @@
+from typing import List, Optional
+
+from .chapter import Chapter
+from .novel import Novel
+from .profile import Profile
+from ..tools import UrlTools
+
+
+class _Slotted:
+    """
+    repr and equality over __slots__, as dataclasses provide over fields
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__ if not name.startswith('_'))
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class CompactChapter(_Slotted):
+    """
+    memory lean counterpart of Chapter
+
+    paragraphs are kept joined in a single string and split when read,
+    url is derived from [novel_id] and [id] rather than stored.
+    no paragraphs, or paragraphs containing the separator, are kept as a tuple so they read back the same
+    """
+    __slots__ = ('no', 'id', 'novel_id', 'title', '_text', 'locked', 'cost', 'type')
+
+    # paragraphs are joined by the record separator, which does not occur in text
+    separator = '\x1e'
+
+    def __init__(self, no: int = None, id: int = None, novel_id: int = None, title: str = None,
+                 paragraphs: List[str] = None, locked: bool = None, cost: int = None, type: int = None):
+        self.no = no
+        self.id = id
+        self.novel_id = novel_id
+        self.title = title
+        self.paragraphs = paragraphs
+        self.locked = locked
+        self.cost = cost
+        self.type = type
+
+    @property
+    def paragraphs(self) -> Optional[List[str]]:
+        if self._text is None:
+            return None
+        if isinstance(self._text, tuple):
+            return list(self._text)
+
+        return self._text.split(self.separator)
+
+    @paragraphs.setter
+    def paragraphs(self, value: Optional[List[str]]):
+        if value is None:
+            self._text = None
+        elif not value or any(self.separator in paragraph for paragraph in value):
+            self._text = tuple(value)
+        else:
+            self._text = self.separator.join(value)
+
+    @property
+    def text(self) -> Optional[str]:
+        """
+        :return: paragraphs joined by new lines, without splitting them first
+        """
+        if self._text is None:
+            return None
+        if isinstance(self._text, tuple):
+            return '\n'.join(self._text)
+
+        return self._text.replace(self.separator, '\n')
+
+    @property
+    def url(self) -> str:
+        return UrlTools.to_chapter_url(self.novel_id, self.id)
+
+    def chapter_id_from_url(self) -> int:
+        return int(self.id)
+
+    def novel_id_from_url(self) -> int:
+        return int(self.novel_id)
+
+    @staticmethod
+    def from_chapter(chapter: Chapter, novel_id: int = None) -> 'CompactChapter':
+        """
+        :param chapter: chapter to convert
+        :param novel_id: novel of the chapter, taken from the chapter url when not given
+        """
+        if novel_id is None:
+            novel_id = chapter.novel_id_from_url()
+
+        return CompactChapter(
+            no=chapter.no,
+            id=chapter.id,
+            novel_id=novel_id,
+            title=chapter.title,
+            paragraphs=chapter.paragraphs,
+            locked=chapter.locked,
+            cost=chapter.cost,
+            type=chapter.type,
+        )
+
+    def to_chapter(self) -> Chapter:
+        return Chapter(
+            no=self.no,
+            id=self.id,
+            url=self.url,
+            title=self.title,
+            paragraphs=self.paragraphs,
+            locked=self.locked,
+            cost=self.cost,
+            type=self.type,
+        )
+
+
+class CompactNovel(_Slotted):
+    """
+    memory lean counterpart of Novel, url and cover_url are derived from [id]
+    """
+    __slots__ = ('id', 'title', 'synopsis', 'genre', 'author', 'translator', 'editor', 'views', 'rating',
+                 'review_count')
+
+    def __init__(self, id: int = None, title: str = None, synopsis: str = None, genre: str = None,
+                 author: str = None, translator: str = None, editor: str = None, views: str = None,
+                 rating: float = None, review_count: int = None):
+        self.id = id
+        self.title = title
+        self.synopsis = synopsis
+        self.genre = genre
+        self.author = author
+        self.translator = translator
+        self.editor = editor
+        self.views = views
+        self.rating = rating
+        self.review_count = review_count
+
+    @property
+    def url(self) -> str:
+        return UrlTools.to_novel_url(self.id)
+
+    @property
+    def cover_url(self) -> str:
+        return f'https://img.webnovel.com/bookcover/{self.id}'
+
+    @staticmethod
+    def from_novel(novel: Novel) -> 'CompactNovel':
+        return CompactNovel(**{name: getattr(novel, name) for name in CompactNovel.__slots__})
+
+    def to_novel(self) -> Novel:
+        return Novel(url=self.url, cover_url=self.cover_url,
+                     **{name: getattr(self, name) for name in self.__slots__})
+
+
+class CompactProfile(_Slotted):
+    """
+    memory lean counterpart of Profile
+    """
+    __slots__ = ('id', 'coins', 'fastpass', 'power_stone', 'energy_stone')
+
+    fields = Profile.fields
+
+    def __init__(self, id: int = None, coins: int = None, fastpass: int = None, power_stone: int = None,
+                 energy_stone: int = None):
+        self.id = id
+        self.coins = coins
+        self.fastpass = fastpass
+        self.power_stone = power_stone
+        self.energy_stone = energy_stone
+
+    @staticmethod
+    def from_profile(profile: Profile) -> 'CompactProfile':
+        return CompactProfile(**{name: getattr(profile, name) for name in CompactProfile.__slots__})
+
+    def to_profile(self) -> Profile:
+        return Profile(**{name: getattr(self, name) for name in self.__slots__})
@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-from bs4 import BeautifulSoup
-
 
 @dataclass
 class Profile:
@@ -25,15 +23,7 @@ class Profile:
         :param user_id: id of user profile
         :return: profile of user
         """
-        soup = BeautifulSoup(html, 'lxml')
-
-        profile = Profile(id=user_id)
-
-        group = soup.select("div[class='fl'] > a.dib.mr32, div[class='fl'] > a.dib.mr16")
-
-        profile.coins = int(group[0].text)
-        profile.fastpass = int(group[1].text)
-        profile.power_stone = int(group[2].text)
-        profile.energy_stone = int(group[3].text)
+        # imported here as parsers depend on models
+        from ..parsers import get_parser
 
-        return profile
+        return get_parser().profile(html, user_id)
@@ -0,0 +1,39 @@
+import threading
+
+from .interface import IParser
+from ..lazy import lazy_attributes
+
+# bs4 and lxml are imported with the parser using them
+__getattr__, __dir__, _parsers = lazy_attributes(__name__, {
+    'SoupParser': '.soup',
+    'XPathParser': '.xpath',
+})
+
+__all__ = ['IParser', 'get_parser', 'set_parser'] + _parsers
+
+_parser = None
+_parser_lock = threading.Lock()
+
+
+def get_parser() -> IParser:
+    """
+    :return: parser used for pages, an XPathParser unless replaced with set_parser
+    """
+    global _parser
+
+    with _parser_lock:
+        if _parser is None:
+            from .xpath import XPathParser
+            _parser = XPathParser()
+
+        return _parser
+
+
+def set_parser(parser: IParser):
+    """
+    replace the parser used for pages by Novel.from_url, Profile.from_html and WebnovelBot.table_of_contents
+    """
+    global _parser
+
+    with _parser_lock:
+        _parser = parser
@@ -0,0 +1,32 @@
+from typing import Dict, List, Union
+
+from ..models import Chapter, Novel, Profile
+
+
+class IParser:
+    """
+    extracts models from the html of webnovel pages
+    """
+
+    def novel(self, html: Union[str, bytes], url: str) -> Novel:
+        """
+        :param html: novel page
+        :param url: url of the novel page
+        :return: Novel object
+        """
+        raise NotImplementedError('method not overridden')
+
+    def profile(self, html: Union[str, bytes], user_id=None) -> Profile:
+        """
+        :param html: profile page
+        :param user_id: id of user profile
+        :return: profile of user
+        """
+        raise NotImplementedError('method not overridden')
+
+    def table_of_contents(self, html: Union[str, bytes]) -> Dict[str, List[Chapter]]:
+        """
+        :param html: novel page with the table of contents loaded
+        :return: dict of volumes in order, where key is volume name and value the chapters
+        """
+        raise NotImplementedError('method not overridden')
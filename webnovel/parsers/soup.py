@@ -0,0 +1,108 @@
+import re
+from typing import Dict, List, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .interface import IParser
+from ..models import Chapter, Novel, Profile
+
+
+class SoupParser(IParser):
+    """
+    BeautifulSoup over lxml, building only the subtrees each page needs
+    """
+
+    # depending on the version, bs4 matches against the whole class attribute or each class in it
+    _novel_only = SoupStrainer(
+        class_=lambda value: value is not None and ('_mn' in value.split() or 'j_synopsis' in value)
+    )
+    _profile_only = SoupStrainer('div', class_='fl')
+    _toc_only = SoupStrainer('div', class_='volume-item')
+
+    def novel(self, html: Union[str, bytes], url: str) -> Novel:
+        soup = BeautifulSoup(html, 'lxml', parse_only=self._novel_only)
+
+        info_elems = soup.select('._mn > *')
+        subinfo_elems = info_elems[1].select(':scope > *')
+        writerinfo_elems = info_elems[2].select('p > *')
+
+        novel = Novel()
+        novel.id = int(url.split('/')[4])
+        novel.title = info_elems[0].text[:-len(info_elems[0].find('small').text) - 1]
+
+        novel.synopsis = soup.select_one("div[class*='j_synopsis'] > p").text
+        novel.genre = subinfo_elems[0].text.strip()
+        novel.views = subinfo_elems[-1].text[:-6].strip()
+        novel.url = url[:]
+        novel.cover_url = f'https://img.webnovel.com/bookcover/{novel.id}'
+
+        try:
+            # ratings are posted up to 5, they are converted to float and normalized to 1
+            novel.rating = float(info_elems[3].find('strong').text) / 5.0
+        except ValueError:
+            # no ratings
+            novel.rating = None
+
+        try:
+            # stripped of all non numerals and converted to int
+            novel.review_count = int(
+                info_elems[3].find('small').text.strip('()')[:-8].replace(',', ''))
+        except ValueError:
+            # not enough reviews
+            novel.review_count = None
+
+        # writer info
+        for i in range(round(len(writerinfo_elems) / 2)):
+            label = writerinfo_elems[i * 2].text.strip(': ').lower()
+            value = writerinfo_elems[i * 2 + 1].text
+
+            setattr(novel, label, value)
+
+        return novel
+
+    def profile(self, html: Union[str, bytes], user_id=None) -> Profile:
+        soup = BeautifulSoup(html, 'lxml', parse_only=self._profile_only)
+
+        profile = Profile(id=user_id)
+
+        group = soup.select("div[class='fl'] > a.dib.mr32, div[class='fl'] > a.dib.mr16")
+
+        profile.coins = int(group[0].text)
+        profile.fastpass = int(group[1].text)
+        profile.power_stone = int(group[2].text)
+        profile.energy_stone = int(group[3].text)
+
+        return profile
+
+    def table_of_contents(self, html: Union[str, bytes]) -> Dict[str, List[Chapter]]:
+        soup = BeautifulSoup(html, 'lxml', parse_only=self._toc_only)
+
+        volume_elements = soup.find_all('div', {'class': 'volume-item'})
+        volumes = {}
+        for volume_element in volume_elements:
+            volume_chapters = volume_element.find_all('li', {'class': 'g_col_6'})
+
+            chapters = []
+            for chapter in volume_chapters:
+                no_element = chapter.select_one('a > i')
+
+                chapter = Chapter(
+                    title=chapter.select_one('a')['title'],
+                    url=f"http:{chapter.find('a')['href'].strip()}",
+                    locked=bool(chapter.select('a > svg'))
+                )
+
+                if no_element is not None:
+                    chapter.no = int(no_element.text.strip())
+                else:
+                    chapter.no = 0
+
+                chapter.id = chapter.chapter_id_from_url()
+
+                chapters.append(chapter)
+
+            _name = volume_element.find('h4').text
+            volume_name = re.sub(r'\n +', '', _name).replace(':', ': ')
+            volumes[volume_name] = chapters
+
+        return volumes
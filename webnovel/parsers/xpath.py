@@ -0,0 +1,119 @@
+import re
+from typing import Dict, List, Union
+
+from lxml import etree, html as lxml_html
+
+from .interface import IParser
+from ..models import Chapter, Novel, Profile
+
+
+def _class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class XPathParser(IParser):
+    """
+    lxml with xpath expressions compiled once, equivalent to SoupParser and several times faster
+    """
+
+    # novel page
+    _info = etree.XPath(f'//*[{_class("_mn")}]/*')
+    _children = etree.XPath('./*')
+    _writer_info = etree.XPath('.//p/*')
+    _small = etree.XPath('(.//small)[1]')
+    _strong = etree.XPath('(.//strong)[1]')
+    _synopsis = etree.XPath("(//div[contains(@class, 'j_synopsis')]/p)[1]")
+
+    # profile page
+    _stones = etree.XPath(
+        f"//div[@class='fl']/a[{_class('dib')} and ({_class('mr32')} or {_class('mr16')})]"
+    )
+
+    # table of contents
+    _volumes = etree.XPath(f'//div[{_class("volume-item")}]')
+    _volume_name = etree.XPath('(.//h4)[1]')
+    _chapters = etree.XPath(f'.//li[{_class("g_col_6")}]')
+    _link = etree.XPath('(.//a)[1]')
+    _no = etree.XPath('(.//a/i)[1]')
+    _lock = etree.XPath('.//a/svg')
+
+    def novel(self, html: Union[str, bytes], url: str) -> Novel:
+        root = lxml_html.fromstring(html)
+
+        info_elems = self._info(root)
+        subinfo_elems = self._children(info_elems[1])
+        writerinfo_elems = self._writer_info(info_elems[2])
+
+        novel = Novel()
+        novel.id = int(url.split('/')[4])
+        novel.title = self._text(info_elems[0])[:-len(self._text(self._small(info_elems[0])[0])) - 1]
+
+        novel.synopsis = self._text(self._synopsis(root)[0])
+        novel.genre = self._text(subinfo_elems[0]).strip()
+        novel.views = self._text(subinfo_elems[-1])[:-6].strip()
+        novel.url = url[:]
+        novel.cover_url = f'https://img.webnovel.com/bookcover/{novel.id}'
+
+        try:
+            # ratings are posted up to 5, they are converted to float and normalized to 1
+            novel.rating = float(self._text(self._strong(info_elems[3])[0])) / 5.0
+        except ValueError:
+            # no ratings
+            novel.rating = None
+
+        try:
+            # stripped of all non numerals and converted to int
+            novel.review_count = int(
+                self._text(self._small(info_elems[3])[0]).strip('()')[:-8].replace(',', ''))
+        except ValueError:
+            # not enough reviews
+            novel.review_count = None
+
+        # writer info
+        for i in range(round(len(writerinfo_elems) / 2)):
+            label = self._text(writerinfo_elems[i * 2]).strip(': ').lower()
+            value = self._text(writerinfo_elems[i * 2 + 1])
+
+            setattr(novel, label, value)
+
+        return novel
+
+    def profile(self, html: Union[str, bytes], user_id=None) -> Profile:
+        group = self._stones(lxml_html.fromstring(html))
+
+        profile = Profile(id=user_id)
+
+        profile.coins = int(self._text(group[0]))
+        profile.fastpass = int(self._text(group[1]))
+        profile.power_stone = int(self._text(group[2]))
+        profile.energy_stone = int(self._text(group[3]))
+
+        return profile
+
+    def table_of_contents(self, html: Union[str, bytes]) -> Dict[str, List[Chapter]]:
+        volumes = {}
+        for volume_element in self._volumes(lxml_html.fromstring(html)):
+            chapters = []
+            for element in self._chapters(volume_element):
+                link = self._link(element)[0]
+                no_element = self._no(element)
+
+                chapter = Chapter(
+                    title=link.get('title'),
+                    url=f"http:{link.get('href').strip()}",
+                    locked=bool(self._lock(element)),
+                    no=int(self._text(no_element[0]).strip()) if no_element else 0,
+                )
+                chapter.id = chapter.chapter_id_from_url()
+
+                chapters.append(chapter)
+
+            _name = self._text(self._volume_name(volume_element)[0])
+            volume_name = re.sub(r'\n +', '', _name).replace(':', ': ')
+            volumes[volume_name] = chapters
+
+        return volumes
+
+    @staticmethod
+    def _text(element) -> str:
+        return element.text_content()
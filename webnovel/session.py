@@ -0,0 +1,220 @@
+import json
+import os
+import time
+from typing import List, Optional, Union, Iterable
+
+from lxml.etree import LxmlError
+from requests import RequestException
+from requests.cookies import RequestsCookieJar
+
+from .api import ParsedApi
+from .exceptions import ApiError
+from .models import Profile
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+    InvalidToken = ValueError
+
+BASE_URL = 'https://www.webnovel.com'
+
+
+def cookie_dicts(cookies: Union[RequestsCookieJar, List[dict]]) -> List[dict]:
+    """
+    :param cookies: cookie jar, or cookies as returned by WebDriver.get_cookies
+    :return: cookies in the form of WebDriver.get_cookies
+    """
+    if isinstance(cookies, list):
+        return [dict(cookie) for cookie in cookies]
+
+    return [
+        {
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path,
+            'secure': bool(cookie.secure),
+            **({'expiry': int(cookie.expires)} if cookie.expires else {}),
+        }
+        for cookie in cookies
+    ]
+
+
+def cdp_cookies(cookies: List[dict]) -> List[dict]:
+    """
+    :param cookies: cookies in the form of WebDriver.get_cookies
+    :return: cookies in the form of Network.setCookies
+    """
+    converted = []
+    for cookie in cookies:
+        params = {key: cookie[key] for key in ('name', 'value', 'path', 'secure', 'httpOnly') if key in cookie}
+        if cookie.get('domain'):
+            params['domain'] = cookie['domain']
+        else:
+            params['url'] = BASE_URL
+        if cookie.get('expiry'):
+            params['expires'] = cookie['expiry']
+
+        converted.append(params)
+
+    return converted
+
+
+class SessionStore:
+    """
+    keeps the cookies of a signed in session in a file, so later runs can restore it instead of signing in
+
+    the file is encrypted with [key], which requires the cryptography package.
+    only with encrypt=False is it kept without a key, as plain json readable only by the owner
+
+    example usage:
+
+        store = SessionStore('session.bin', key=os.environ['WEBNOVEL_SESSION_KEY'])
+
+        api = store.restore_api()
+        if api is None:
+            webnovel.signin(USER_EMAIL, USER_PASS)
+            store.save(webnovel.driver.get_cookies())
+
+    """
+
+    def __init__(self, path: str, key: Union[bytes, str, None] = None, required: Iterable[str] = ('uid',),
+                 encrypt: bool = True):
+        """
+        :param path: file the session is kept in
+        :param key: key from SessionStore.generate_key
+        :param required: cookies without which the session is signed out
+        :param encrypt: False to keep the file unencrypted, without a key
+        :raises ValueError: if no key is given while [encrypt], or one is given while not
+        """
+        if encrypt and key is None:
+            raise ValueError('[key] is required to encrypt the session, pass encrypt=False to keep it as plain json')
+        if not encrypt and key is not None:
+            raise ValueError('[key] is given but encrypt=False')
+
+        if key is not None and Fernet is None:
+            raise ImportError('cryptography is required to encrypt the session')
+
+        self.path = path
+        self.required = tuple(required)
+
+        self._fernet = None if key is None else Fernet(key)
+
+    @staticmethod
+    def generate_key() -> bytes:
+        """
+        :return: new key for SessionStore, keep it outside of the session file
+        """
+        if Fernet is None:
+            raise ImportError('cryptography is required to encrypt the session')
+
+        return Fernet.generate_key()
+
+    def save(self, cookies: Union[RequestsCookieJar, List[dict]]):
+        """
+        :param cookies: cookies of a signed in session, from WebDriver.get_cookies or BaseApi.session.cookies
+        """
+        data = json.dumps({'saved_at': time.time(), 'cookies': cookie_dicts(cookies)}).encode('utf-8')
+        if self._fernet is not None:
+            data = self._fernet.encrypt(data)
+
+        # written whole and readable only by the owner
+        temporary = f'{self.path}.tmp'
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, self.path)
+
+    def load(self) -> Optional[List[dict]]:
+        """
+        :return: unexpired cookies of the session, None if there is no session or it has expired
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+
+            if self._fernet is not None:
+                data = self._fernet.decrypt(data)
+
+            cookies = json.loads(data)['cookies']
+
+        # missing, corrupt or saved with a different key
+        except (OSError, ValueError, KeyError, InvalidToken):
+            return None
+
+        now = time.time()
+        cookies = [cookie for cookie in cookies if not cookie.get('expiry') or cookie['expiry'] > now]
+
+        names = {cookie['name'] for cookie in cookies}
+        if not all(name in names for name in self.required):
+            return None
+
+        return cookies
+
+    def expires_at(self) -> Optional[float]:
+        """
+        :return: unix time the first of the required cookies expires,
+                 None if there is no session or none of them expire
+        """
+        cookies = self.load()
+        if cookies is None:
+            return None
+
+        expiries = [cookie['expiry'] for cookie in cookies if cookie['name'] in self.required and cookie.get('expiry')]
+
+        return min(expiries, default=None)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def restore_api(self, check: bool = True, **kwargs) -> Optional[ParsedApi]:
+        """
+        :param check: make a request to confirm the session is still signed in
+        :param kwargs: passed to ParsedApi
+        :return: api with the cookies of the session, None if there is no live session
+        """
+        cookies = self.load()
+        if cookies is None:
+            return None
+
+        api = ParsedApi(cookies, **kwargs)
+        if check and not self.is_alive(api):
+            return None
+
+        return api
+
+    def restore_bot(self, bot, check: bool = True) -> bool:
+        """
+        :param bot: WebnovelBot to load the cookies of the session into
+        :param check: make a request to confirm the session is still signed in
+        :return: whether a live session was restored
+        """
+        cookies = self.load()
+        if cookies is None:
+            return False
+
+        if check and not self.is_alive(ParsedApi(cookies)):
+            return False
+
+        bot.add_cookiejar(cookies)
+        return True
+
+    @staticmethod
+    def is_alive(api: ParsedApi) -> bool:
+        """
+        :return: whether the cookies of [api] are of a signed in session, by reading the profile page,
+                 False when it cannot be read
+        """
+        if api.session.cookies.get('uid') is None:
+            return False
+
+        try:
+            Profile.from_html(api.html.profile())
+        except (ApiError, RequestException, IndexError, ValueError, LxmlError):
+            return False
+
+        return True
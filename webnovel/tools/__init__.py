@@ -1 +1,2 @@
 from .url import UrlTools
+from .text import TextTools
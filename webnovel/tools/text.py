@@ -0,0 +1,45 @@
+import html
+import re
+from typing import Iterable, List
+
+
+class TextTools:
+    """
+    text extraction from the html fragments of chapter content
+    """
+
+    # comments, script and style blocks are dropped along with their content, other tags on their own
+    _markup = re.compile(
+        r'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<[a-zA-Z/!?](?:"[^"]*"|\'[^\']*\'|[^\'">])*>',
+        re.DOTALL | re.IGNORECASE
+    )
+
+    @staticmethod
+    def to_text(fragment: str) -> str:
+        """
+        text of an html fragment, as BeautifulSoup(fragment, 'lxml').text would give
+        for the well formed fragments webnovel returns
+
+        :param fragment: html fragment, such as the content of a paragraph
+        :return: fragment without markup and with entities resolved
+        """
+        # whitespace preceding the content is not part of the document
+        fragment = fragment.lstrip(' \t\n\r\f')
+
+        if '<' in fragment:
+            fragment = TextTools._markup.sub('', fragment)
+        if '&' in fragment:
+            fragment = html.unescape(fragment)
+        if '\r' in fragment:
+            fragment = fragment.replace('\r\n', '\n').replace('\r', '\n')
+
+        return fragment
+
+    @staticmethod
+    def paragraphs(contents: Iterable[dict]) -> List[str]:
+        """
+        :param contents: paragraph items of a chapter response, with the fragment under 'content'
+        :return: text of each paragraph
+        """
+        to_text = TextTools.to_text
+        return [to_text(para['content']) for para in contents]